@@ -0,0 +1,67 @@
+"""
+Page-load time per page with NETWORK_PROFILE=full vs. lean (blocked images, fonts, analytics).
+Runs against BASE_URL (the real site by default — the local stand-in has no heavy assets).
+
+    uv run python -m benchmarks.bench_network --rounds 5
+"""
+import argparse
+import os
+import statistics
+
+from src.pages.cart_page import CartPage
+from src.pages.login_page import LoginPage
+from src.utils.config import url
+from src.utils.data import VALID_USER
+from src.utils.driver import create_driver
+
+PAGES = {
+    "login": "",
+    "inventory": "inventory.html",
+    "cart": "cart.html",
+    "checkout-step-one": "checkout-step-one.html",
+    "checkout-step-two": "checkout-step-two.html",
+}
+
+NAV_TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var bytes = nav.transferSize + performance.getEntriesByType('resource')
+    .reduce(function (s, r) { return s + (r.transferSize || 0); }, 0);
+return {load_ms: nav.loadEventEnd - nav.startTime, bytes: bytes};
+"""
+
+
+def measure(profile: str, rounds: int) -> dict[str, list[dict]]:
+    results: dict[str, list[dict]] = {name: [] for name in PAGES}
+    os.environ["NETWORK_PROFILE"] = profile  # create_driver применяет профиль сам
+    driver = create_driver()
+    try:
+        # логин один раз: дальше все страницы открываются прямой навигацией
+        LoginPage(driver).inject_session(VALID_USER, landing=None)
+        CartPage(driver).seed(["Sauce Labs Backpack"], open_cart=False)
+        for _ in range(rounds):
+            for name, path in PAGES.items():
+                driver.get(url(path))
+                results[name].append(driver.execute_script(NAV_TIMING_JS))
+    finally:
+        driver.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    full = measure("full", args.rounds)
+    lean = measure("lean", args.rounds)
+    print(f"{'page':<20} {'full ms':>9} {'lean ms':>9} {'full KB':>9} {'lean KB':>9}")
+    for name in PAGES:
+        f_ms = statistics.median(r["load_ms"] for r in full[name])
+        l_ms = statistics.median(r["load_ms"] for r in lean[name])
+        f_kb = statistics.median(r["bytes"] for r in full[name]) / 1024
+        l_kb = statistics.median(r["bytes"] for r in lean[name]) / 1024
+        print(f"{name:<20} {f_ms:>9.0f} {l_ms:>9.0f} {f_kb:>9.1f} {l_kb:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Page-object micro-benchmarks against the local stand-in site, compared with stored baselines.
+
+Each operation runs --repeat times after its own (unmeasured) setup; wall time and WebDriver
+command count are recorded per run. A slowdown is flagged when the one-sided Mann–Whitney
+test says the new times are greater (p < --alpha) and the median grew by more than --min-change,
+or when the command count grew.
+
+    uv run python -m benchmarks.bench_page_objects --save            # record baselines
+    uv run python -m benchmarks.bench_page_objects                   # compare with them
+    uv run python -m benchmarks.bench_page_objects --only login finish --check   # exit 1 on regression
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.common import browser, local_site, open_cart
+from src.pages.checkout_page import CheckoutStepOnePage, CheckoutStepTwoPage
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.utils.data import USER_INFO, VALID_USER
+from src.utils.profiler import CommandProfiler
+from src.utils.stats import mann_whitney_greater
+
+BASELINE = Path(__file__).with_name("baselines") / "page_objects.json"
+ITEMS = ["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Bolt T-Shirt", "Sauce Labs Fleece Jacket"]
+
+
+def _logged_out(driver):
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.get("about:blank")
+
+
+def _login(driver):
+    login = LoginPage(driver)
+    login.open()
+    login.login(VALID_USER["username"], VALID_USER["password"])
+    login.wait_success()
+
+
+def _inventory(driver):
+    LoginPage(driver).inject_session(VALID_USER, landing=None)
+    # пустая корзина до рендера inventory, иначе кнопка окажется "Remove"
+    driver.execute_script("window.localStorage.removeItem('cart-contents'); window.location.assign(arguments[0]);",
+                          MainPage.URL)
+    main = MainPage(driver)
+    main.wait_until_loaded()
+    return main
+
+
+def _step_one(driver):
+    open_cart(driver, ITEMS).proceed_to_checkout()
+    step_1 = CheckoutStepOnePage(driver)
+    step_1.wait_until_loaded()
+    return step_1
+
+
+def _filled_step_one(driver):
+    step_1 = _step_one(driver)
+    step_1.fill_in_the_form(USER_INFO["first_name"], USER_INFO["last_name"], USER_INFO["postal_code"])
+    return step_1
+
+
+def _step_two(driver):
+    _filled_step_one(driver).proceed_to_payment()
+    step_2 = CheckoutStepTwoPage(driver)
+    step_2.wait_until_loaded()
+    return step_2
+
+
+# name -> (setup(driver) -> subject, operation(driver, subject))
+OPERATIONS = {
+    "login": (_logged_out, lambda d, _: _login(d)),
+    "add_item_to_cart": (_inventory, lambda d, main: main.add_item_to_cart("Sauce Labs Backpack")),
+    "get_item_names": (_inventory, lambda d, main: main.get_item_names()),
+    "remove_item_by_name": (lambda d: open_cart(d, ITEMS), lambda d, cart: cart.remove_item_by_name("Sauce Labs Bike Light")),
+    "fill_in_the_form": (_step_one, lambda d, step_1: step_1.fill_in_the_form(
+        USER_INFO["first_name"], USER_INFO["last_name"], USER_INFO["postal_code"])),
+    "proceed_to_payment": (_filled_step_one, lambda d, step_1: step_1.proceed_to_payment()),
+    "finish": (_step_two, lambda d, step_2: step_2.finish()),
+}
+
+
+def run_operation(driver, name: str, repeat: int) -> dict:
+    setup, operation = OPERATIONS[name]
+    times, commands = [], []
+    for _ in range(repeat):
+        subject = setup(driver)
+        with CommandProfiler(driver) as profiler:
+            start = time.perf_counter()
+            operation(driver, subject)
+            times.append(time.perf_counter() - start)
+        commands.append(profiler.total)
+    return {"times_s": times, "commands": commands}
+
+
+def compare(name: str, base: dict | None, now: dict, alpha: float, min_change: float) -> dict:
+    row = {
+        "operation": name,
+        "now_ms": statistics.median(now["times_s"]) * 1000,
+        "now_cmds": statistics.median(now["commands"]),
+        "base_ms": None, "base_cmds": None, "change": None, "p": None, "verdict": "new",
+    }
+    if not base:
+        return row
+    base_ms = statistics.median(base["times_s"]) * 1000
+    row.update(base_ms=base_ms, base_cmds=statistics.median(base["commands"]),
+               change=row["now_ms"] / base_ms - 1 if base_ms else 0.0,
+               p=mann_whitney_greater(base["times_s"], now["times_s"]))
+    if row["now_cmds"] > row["base_cmds"]:
+        row["verdict"] = "REGRESSION (commands)"
+    elif row["p"] < alpha and row["change"] > min_change:
+        row["verdict"] = "REGRESSION"
+    elif mann_whitney_greater(now["times_s"], base["times_s"]) < alpha and row["change"] < -min_change:
+        row["verdict"] = "faster"
+    else:
+        row["verdict"] = "same"
+    return row
+
+
+def print_table(rows: list[dict]):
+    def fmt(value, spec):
+        return format(value, spec) if value is not None else "—"
+
+    print(f"{'operation':<20} {'base ms':>8} {'now ms':>8} {'change':>8} {'p':>7} {'cmds':>9}  verdict")
+    for r in rows:
+        cmds = f"{fmt(r['base_cmds'], '.0f')}→{r['now_cmds']:.0f}"
+        change = f"{r['change'] * 100:+.1f}%" if r["change"] is not None else "—"
+        print(f"{r['operation']:<20} {fmt(r['base_ms'], '8.1f'):>8} {r['now_ms']:>8.1f} {change:>8} "
+              f"{fmt(r['p'], '7.3f'):>7} {cmds:>9}  {r['verdict']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--only", nargs="+", choices=list(OPERATIONS), help="run a subset of operations")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--alpha", type=float, default=0.01, help="significance level")
+    parser.add_argument("--min-change", type=float, default=0.05, help="ignore median changes below this share")
+    parser.add_argument("--check", action="store_true", help="exit with 1 when a regression is flagged")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    results = {}
+    with local_site(), browser() as driver:
+        for name in args.only or OPERATIONS:
+            results[name] = run_operation(driver, name, args.repeat)
+
+    rows = [compare(name, baseline.get(name), now, args.alpha, args.min_change) for name, now in results.items()]
+    print_table(rows)
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2), encoding="utf-8")
+        print(f"baseline saved: {args.baseline}")
+    if args.check and any(r["verdict"].startswith("REGRESSION") for r in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Suite wall time: fresh Chrome per test vs. pooled warm sessions.
+
+    uv run python -m benchmarks.bench_pool                 # tests/test_1.py, 3 rounds
+    uv run python -m benchmarks.bench_pool tests --rounds 1
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_suite(targets: list[str], pooled: bool) -> float:
+    env = dict(os.environ, DRIVER_POOL="true" if pooled else "false")
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *targets],
+                   cwd=ROOT, env=env, check=False,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", default=["tests/test_1.py"])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {"per-test": [], "pooled": []}
+    for _ in range(args.rounds):
+        # чередуем режимы, чтобы фон (сеть, кэш) влиял на оба одинаково
+        results["per-test"].append(run_suite(args.targets, pooled=False))
+        results["pooled"].append(run_suite(args.targets, pooled=True))
+
+    print(f"{'mode':<10} {'median, s':>10} {'min, s':>8} {'max, s':>8}")
+    for mode, times in results.items():
+        print(f"{mode:<10} {statistics.median(times):>10.2f} {min(times):>8.2f} {max(times):>8.2f}")
+    speedup = statistics.median(results["per-test"]) / statistics.median(results["pooled"])
+    print(f"speedup: x{speedup:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Suite wall time per ALLURE_STEPS mode (full / buffered / off), on the local stand-in site,
+with Allure results written to a temp dir as in a real run.
+
+    uv run python -m benchmarks.bench_reporting                     # whole suite, 3 rounds
+    uv run python -m benchmarks.bench_reporting tests/test_4.py --rounds 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MODES = ("full", "buffered", "off")
+
+
+def run_suite(targets: list[str], mode: str) -> float:
+    env = dict(os.environ, ALLURE_STEPS=mode, LOCAL_SITE="true")
+    with tempfile.TemporaryDirectory(prefix="allure-bench-") as results:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+                        f"--alluredir={results}", *targets],
+                       cwd=ROOT, env=env, check=False,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", default=["tests"])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {mode: [] for mode in MODES}
+    for _ in range(args.rounds):
+        # режимы чередуются, чтобы фон влиял на все одинаково
+        for mode in MODES:
+            results[mode].append(run_suite(args.targets, mode))
+
+    base = statistics.median(results["off"])
+    print(f"{'mode':<10} {'median, s':>10} {'min, s':>8} {'max, s':>8} {'overhead':>9}")
+    for mode, times in results.items():
+        median = statistics.median(times)
+        print(f"{mode:<10} {median:>10.2f} {min(times):>8.2f} {max(times):>8.2f} {(median / base - 1) * 100:>+8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+How page-object methods scale with the catalog size (generated catalogs of the local site).
+
+For every size the inventory has that many products and the cart holds all of them; each method
+is timed --repeat times (median) with its WebDriver command count. The log-log slope of latency
+and commands against size is printed per method: latency slope ≈ 1 is linear, > --max-slope is
+flagged as super-linear; a command slope above 0 means round trips grow with the catalog.
+
+    uv run python -m benchmarks.bench_scaling                          # 100, 1000, 10000 items
+    uv run python -m benchmarks.bench_scaling --sizes 100 1000 --csv scaling.csv
+"""
+import argparse
+import csv
+import math
+import os
+import statistics
+import time
+
+from benchmarks.common import browser, local_site
+from src.pages.cart_page import CartPage
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.utils.data import VALID_USER
+from src.utils.fixture_server import catalog
+from src.utils.profiler import CommandProfiler
+
+
+def open_inventory(driver) -> MainPage:
+    LoginPage(driver).inject_session(VALID_USER, landing=None)
+    driver.execute_script("window.localStorage.removeItem('cart-contents'); window.location.assign(arguments[0]);",
+                          MainPage.URL)
+    main = MainPage(driver)
+    main.wait_until_loaded()
+    return main
+
+
+def open_full_cart(driver, size: int) -> CartPage:
+    LoginPage(driver).inject_session(VALID_USER, landing=None)
+    driver.execute_script("window.localStorage.setItem('cart-contents', JSON.stringify(arguments[0]));"
+                          " window.location.assign(arguments[1]);", list(range(size)), CartPage.URL)
+    cart = CartPage(driver)
+    cart.wait_until_loaded()
+    return cart
+
+
+def methods(size: int) -> dict:
+    """name -> (setup(driver) -> page, operation(page)); the last product is the worst case for lookups."""
+    last = catalog(size)[-1]["name"]
+    return {
+        "MainPage.get_item_names": (open_inventory, lambda main: main.get_item_names()),
+        "MainPage.add_item_to_cart": (open_inventory, lambda main: main.add_item_to_cart(last)),
+        "CartPage.get_item_prices": (lambda d: open_full_cart(d, size), lambda cart: cart.get_item_prices()),
+        "CartPage.remove_item_by_name": (lambda d: open_full_cart(d, size), lambda cart: cart.remove_item_by_name(last)),
+    }
+
+
+def measure(driver, setup, operation, repeat: int) -> tuple[float, float]:
+    times, commands = [], []
+    for _ in range(repeat):
+        page = setup(driver)
+        with CommandProfiler(driver) as profiler:
+            start = time.perf_counter()
+            operation(page)
+            times.append(time.perf_counter() - start)
+        commands.append(profiler.total)
+    return statistics.median(times), statistics.median(commands)
+
+
+def loglog_slope(sizes: list[int], values: list[float]) -> float:
+    """Least-squares slope of log(value) over log(size): the exponent k in value ~ size^k."""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return 0.0
+    mx = statistics.fmean(x for x, _ in points)
+    my = statistics.fmean(y for _, y in points)
+    var = sum((x - mx) ** 2 for x, _ in points)
+    return sum((x - mx) * (y - my) for x, y in points) / var if var else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-slope", type=float, default=1.15, help="latency exponent flagged as super-linear")
+    parser.add_argument("--csv", help="write size/method/latency/commands rows for plotting")
+    args = parser.parse_args()
+
+    sizes = sorted(args.sizes)
+    results: dict[str, list[tuple[int, float, float]]] = {}
+    with local_site() as server, browser() as driver:
+        driver.set_script_timeout(120)  # снимки списков на 10k строк
+        for size in sizes:
+            os.environ["BASE_URL"] = server.sized_url(size)  # PageUrl читает BASE_URL при каждом обращении
+            for name, (setup, operation) in methods(size).items():
+                latency, commands = measure(driver, setup, operation, args.repeat)
+                results.setdefault(name, []).append((size, latency, commands))
+
+    for name, rows in results.items():
+        peak = max(latency for _, latency, _ in rows) or 1.0
+        lat_slope = loglog_slope(sizes, [latency for _, latency, _ in rows])
+        cmd_slope = loglog_slope(sizes, [commands for _, _, commands in rows])
+        flags = []
+        if lat_slope > args.max_slope:
+            flags.append("SUPER-LINEAR")
+        if cmd_slope > 0.1:
+            flags.append("round trips grow with N")
+        print(f"\n{name}  latency ~ N^{lat_slope:.2f}, commands ~ N^{cmd_slope:.2f}  {' | '.join(flags)}")
+        for size, latency, commands in rows:
+            bar = "█" * max(1, round(latency / peak * 40))
+            print(f"  {size:>6} {latency * 1000:>9.1f} ms {commands:>6.0f} cmds  {bar}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["method", "size", "latency_s", "commands"])
+            for name, rows in results.items():
+                writer.writerows([name, *row] for row in rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+WebDriver round trips for cart reads: per-row find_element/.text vs. CartPage.snapshot().
+
+    uv run python -m benchmarks.bench_snapshot
+"""
+import time
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.common import browser, local_site, open_cart
+from src.utils.data import PRODUCTS
+from src.utils.profiler import CommandProfiler
+
+
+def legacy_names_and_prices(driver):
+    # the old CartPage.get_item_names + get_item_prices: 1 + N round trips each, plus .text per row
+    names, prices = [], []
+    for row in driver.find_elements(By.CLASS_NAME, "cart_item"):
+        names.append(row.find_element(By.CLASS_NAME, "inventory_item_name").text)
+    for row in driver.find_elements(By.CLASS_NAME, "cart_item"):
+        prices.append(float(row.find_element(By.CLASS_NAME, "inventory_item_price").text.replace("$", "")))
+    return names, prices
+
+
+def snapshot_names_and_prices(cart):
+    rows = cart.snapshot()
+    return [r.name for r in rows], [r.price for r in rows]
+
+
+def measure(driver, fn) -> tuple[int, float]:
+    with CommandProfiler(driver) as profiler:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+    return profiler.total, elapsed
+
+
+def main():
+    names = list(PRODUCTS)
+    print(f"{'items':>5} {'legacy cmds':>12} {'legacy ms':>10} {'snapshot cmds':>14} {'snapshot ms':>12}")
+    with local_site(), browser() as driver:
+        for size in (1, 2, 4, len(names)):
+            cart = open_cart(driver, names[:size])
+            legacy = measure(driver, lambda: legacy_names_and_prices(driver))
+            snap = measure(driver, lambda: snapshot_names_and_prices(cart))
+            assert legacy_names_and_prices(driver) == snapshot_names_and_prices(cart)
+            print(f"{size:>5} {legacy[0]:>12} {legacy[1] * 1000:>10.1f} {snap[0]:>14} {snap[1] * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Shared helpers for benchmarks: local stand-in site and a session with state injected."""
+import os
+from contextlib import contextmanager
+
+from src.pages.cart_page import CartPage
+from src.pages.login_page import LoginPage
+from src.utils.data import VALID_USER
+from src.utils.driver import create_driver
+from src.utils.fixture_server import FixtureServer
+
+
+@contextmanager
+def local_site():
+    """Start the fixture server and point BASE_URL at it for the duration of the block."""
+    server = FixtureServer().start()
+    previous = os.environ.get("BASE_URL")
+    os.environ["BASE_URL"] = server.url
+    try:
+        yield server
+    finally:
+        server.stop()
+        if previous is None:
+            os.environ.pop("BASE_URL", None)
+        else:
+            os.environ["BASE_URL"] = previous
+
+
+@contextmanager
+def browser():
+    driver = create_driver()
+    try:
+        yield driver
+    finally:
+        driver.quit()
+
+
+def open_cart(driver, items) -> CartPage:
+    LoginPage(driver).inject_session(VALID_USER, landing=None)
+    cart = CartPage(driver)
+    cart.seed(items)
+    cart.wait_until_loaded()
+    return cart
+
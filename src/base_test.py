@@ -1,8 +1,18 @@
-import os
+import json
+import time
 import unittest
 import allure
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import pytest
+
+from src.utils.artifacts import artifacts
+from src.utils import browser_log
+from src.utils.driver_factory import new_driver, startup_stats_enabled, startup_times
+from src.utils.driver_pool import get_pool, pool_enabled
+from src.utils.perf import page_perf_mode, stats as perf_stats
+from src.utils.profiler import CommandProfiler, profiler_enabled
+from src.utils.reporting import allure_steps_mode, lazy_step, steps
+from src.utils.wait_stats import stats as wait_stats, wait_stats_enabled
+
 
 class UiTestCase(unittest.TestCase):
     """
@@ -11,76 +21,125 @@ class UiTestCase(unittest.TestCase):
       - Стабильные флаги для headless
       - Единый window-size
       - page_load_timeout и нулевой implicit wait (используем явные ожидания)
-      - Скриншот в Allure при падении (до закрытия браузера)
+      - Скриншот в Allure при падении: JPEG через CDP до закрытия браузера, запись в фоне, лимиты ARTIFACT_*
+      - Опциональный пул «тёплых» браузеров через ENV DRIVER_POOL
+      - Статистика ожиданий теста в Allure через ENV WAIT_STATS
+      - Профилирование WebDriver-команд через ENV PROFILE_COMMANDS или @command_budget
+      - Заранее запущенные браузеры через ENV DRIVER_PREWARM, время до первой команды — STARTUP_STATS
+      - Метрики производительности страниц через ENV PAGE_PERF (report/enforce)
+      - Режим шагов Allure через ENV ALLURE_STEPS (full/buffered/off), шаги с URL — step_url()
+      - Консоль, JS-ошибки и упавшие запросы через BiDi (BROWSER_LOG), падение на JS-ошибках —
+        FAIL_ON_JS_ERRORS или @fail_on_js_errors
     """
 
     def setUp(self):
-        headless = os.getenv("HEADLESS", "true").lower() == "true"
-
-        opts = Options()
-
-        # 🔒 disable password manager / save-password bubble / autofill / onboarding
-        prefs = {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            "autofill.profile_enabled": False,
-            "autofill.credit_card_enabled": False,
-            # иногда помогает отключение подсказок по логинам:
-            "credentials_enable_autosignin": False,
-        }
-        opts.add_experimental_option("prefs", prefs)
-        opts.add_argument("--incognito")  # чистый профиль без сохранённых паролей
-        opts.add_argument("--no-first-run")
-        opts.add_argument("--no-default-browser-check")
-        opts.add_argument("--disable-notifications")
-        opts.add_argument("--disable-popup-blocking")
-        # ключевые фичи Chrome, отключающие подсказки/онбординги
-        opts.add_argument(
-            "--disable-features=Autofill,AutofillServerCommunication,AutofillTypeSpecificFeatures,PasswordManagerOnboarding,AccountConsistency,PrivacySandboxSettings4")
-
-        # универсальные флаги
-        opts.add_argument("--disable-gpu")
-        opts.add_argument("--no-sandbox")
-
-        if headless:
-            # Новый движок headless у Chromium
-            opts.add_argument("--headless=new")
-            # фиксированный и достаточно большой вьюпорт
-            opts.add_argument("--window-size=1920,1080")
-            # мелкие «анти-флейк» тюнинги
-            opts.add_argument("--force-device-scale-factor=1")
-            opts.add_argument("--hide-scrollbars")
-            opts.add_argument("--disable-dev-shm-usage")
-        else:
-            # видимый режим
-            opts.add_argument("--start-maximized")
-            opts.add_argument("--window-size=1600,1000")
+        self._problems_at_setup = self._problem_count()
+        artifacts.begin_test()
+        self._wait_mark = wait_stats.mark()
+        self._perf_mark = perf_stats.mark()
+        if allure_steps_mode() == "buffered":
+            steps.begin()
+        started = time.perf_counter()
+        self.pooled = pool_enabled()
+        self.driver = get_pool().acquire() if self.pooled else new_driver()
+        # время получения сессии: взять из пула / из prewarm или запустить Chrome
+        self.driver_acquire_s = time.perf_counter() - started
+        if startup_stats_enabled():
+            startup_times.append(self.driver_acquire_s)
+            allure.attach(f"{self.driver_acquire_s:.3f} s", "Driver acquire time",
+                          allure.attachment_type.TEXT)
+        self.browser_log = browser_log.attach(self.driver)
+        if self.browser_log:
+            self.browser_log.clear()  # сессия из пула могла накопить записи прошлого теста
+
+        self.profiler = None
+        test_method = getattr(self, self._testMethodName)
+        if profiler_enabled() or getattr(test_method, "command_budget", None):
+            self.profiler = CommandProfiler(self.driver).start()
+
+    def step_url(self, label: str = "URL"):
+        """Step with the current URL; in buffered mode it costs a round trip only if the test fails."""
+        lazy_step(label, lambda: self.driver.current_url)
 
-        self.driver = webdriver.Chrome(options=opts)
-        self.driver.set_page_load_timeout(30)
-        self.driver.implicitly_wait(0)  # всегда только явные ожидания
+    def assertNoJsErrors(self, msg: str | None = None):
+        """Fails if the page has thrown uncaught JS errors since the test started."""
+        errors = self.browser_log.js_errors() if self.browser_log else []
+        if errors:
+            self.fail(msg or "Uncaught JS errors:\n" + "\n".join(map(str, errors)))
+
+    def _problem_count(self) -> int:
+        """Errors + failures reported so far: pytest keeps them per test item, unittest — per run."""
+        result = getattr(getattr(self, "_outcome", None), "result", None)
+        if result is None:
+            return 0
+        if hasattr(result, "errors") and hasattr(result, "failures"):
+            return len(result.errors) + len(result.failures)
+        # pytest: result — это TestCaseFunction, исключения теста лежат в _excinfo (skip туда тоже попадает)
+        return sum(1 for e in getattr(result, "_excinfo", None) or [] if not e.errisinstance(pytest.skip.Exception))
+
+    def _failed(self) -> bool:
+        # сравниваем со снимком из setUp: в unittest списки копятся за весь прогон
+        return self._problem_count() > self._problems_at_setup
 
     def tearDown(self):
         # если тест упал — приложим скрин до закрытия браузера
-        failed = False
-        outcome = getattr(self, "_outcome", None)
-        if outcome:
-            result = getattr(outcome, "result", None) or outcome
-            errors = getattr(result, "errors", []) or []
-            failures = getattr(result, "failures", []) or []
-            failed = any(e for _, e in errors + failures)
-
-        if failed:
+        failed = self._failed()
+
+        if failed and artifacts.allowed():
             try:
-                png = self.driver.get_screenshot_as_png()
-                allure.attach(png, name=self.id(), attachment_type=allure.attachment_type.PNG)
-                # опционально URL/DOM (включай по необходимости)
+                # снимок уходит в фоновый writer, файл приложится после quit()
+                artifacts.screenshot(self.driver, self.id())
                 allure.attach(self.driver.current_url, "URL", allure.attachment_type.TEXT)
-                # allure.attach(self.driver.page_source, "DOM", allure.attachment_type.HTML)
+                # опционально DOM (включай по необходимости)
+                # artifacts.dom(self.driver, "DOM")
             except Exception:
                 pass  # не ломаем teardown
 
-        try:
-            self.driver.quit()
-        except Exception:
-            pass
+        js_errors = []
+        if self.browser_log:
+            test_method = getattr(self, self._testMethodName)
+            if failed:
+                if self.browser_log.entries:
+                    allure.attach(self.browser_log.render(), "Browser log", allure.attachment_type.TEXT)
+            elif browser_log.fail_on_js_errors_enabled() or getattr(test_method, "fail_on_js_errors", False):
+                # упавшему тесту вторая ошибка из teardown не нужна
+                js_errors = self.browser_log.js_errors()
+
+        if allure_steps_mode() == "buffered":
+            # до quit(): ленивым шагам упавшего теста ещё нужен драйвер
+            steps.flush(failed)
+
+        if self.profiler:
+            self.profiler.stop()
+            allure.attach(json.dumps(self.profiler.summary(), indent=2), "WebDriver commands",
+                          allure.attachment_type.JSON)
+
+        if wait_stats_enabled():
+            report = wait_stats.test_report(self._wait_mark)
+            allure.attach(json.dumps(report, indent=2), "Wait stats", allure.attachment_type.JSON)
+
+        perf_violations = []
+        if page_perf_mode() != "off":
+            report = perf_stats.test_report(self._perf_mark)
+            if report["records"]:
+                allure.attach(json.dumps(report, indent=2), "Page performance", allure.attachment_type.JSON)
+            if page_perf_mode() == "enforce":
+                perf_violations = report["violations"]
+
+        if self.pooled:
+            # упавшая сессия не возвращается в пул, а пересоздаётся
+            get_pool().release(self.driver, failed=failed)
+        else:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+
+        artifacts.attach_pending()
+
+        # пороги проверяем после закрытия браузера, чтобы не оставлять сессию
+        if perf_violations and not failed:
+            raise AssertionError("Page performance thresholds exceeded: " + "; ".join(perf_violations))
+        if js_errors:
+            allure.attach(self.browser_log.render(), "Browser log", allure.attachment_type.TEXT)
+            raise AssertionError("Uncaught JS errors:\n" + "\n".join(map(str, js_errors)))
@@ -1,14 +1,19 @@
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import allure
+
+from src.pages.snapshot import ItemRow, read_rows
+from src.utils.conditions import clickable, count_is, invisible, present, url_contains
+from src.utils.config import PageUrl
+from src.utils.data import PRODUCTS
+from src.utils.perf import page_perf
+from src.utils.reporting import step
+from src.utils.waits import Wait
 
 class CartPage:
     """Page Object для корзины (cart page) после логина."""
 
-    URL = "https://www.saucedemo.com/cart.html"
+    URL = PageUrl("cart.html")
 
     def __init__(self, driver: WebDriver):
         self.driver = driver
@@ -21,40 +26,48 @@ class CartPage:
         self.btn_checkout = (By.ID, "checkout")
         self.btn_remove_in_item = (By.XPATH, ".//button[contains(@id,'remove') or normalize-space()='Remove']")
 
-    @allure.step("Wait for the page loading")
+    @step("Wait for the page loading")
+    @page_perf
     def wait_until_loaded(self, timeout: int = 10):
-        w = WebDriverWait(self.driver, timeout)
-        w.until(lambda d: "cart" in d.current_url or "cart.html" in d.current_url)
+        w = Wait(self.driver, timeout)
+        w.until(url_contains("cart", "cart.html"))
         # На некоторых стендах .cart_item может быть пустым — ждём checkout-кнопку
-        w.until(EC.presence_of_element_located(self.btn_checkout))
-
-    @allure.step("Check if the page is right")
+        w.until(present(self.btn_checkout))
+
+    @step("Seed cart: {items}")
+    def seed(self, items, open_cart: bool = True):
+        """
+        Writes the cart straight into the `cart-contents` localStorage key in one script call
+        (the browser must already be on the site origin, e.g. after LoginPage.inject_session).
+        """
+        ids = [PRODUCTS[name]["id"] for name in items]
+        self.driver.execute_script("""
+            window.localStorage.setItem('cart-contents', JSON.stringify(arguments[0]));
+            if (arguments[1]) window.location.assign(arguments[1]);
+        """, ids, self.URL if open_cart else None)
+
+    @step("Check if the page is right")
     def is_loaded(self) -> bool:
         return "cart" in self.driver.current_url
 
-    @allure.step("Get items list")
+    @step("Snapshot of cart items")
+    def snapshot(self) -> list[ItemRow]:
+        """All cart rows in one round trip, regardless of the cart size."""
+        return read_rows(self.driver, ".cart_item")
+
+    @step("Get items list")
     def get_item_names(self):
-        items = self.driver.find_elements(*self.cart_items)
-        names = []
-        for row in items:
-            name_el = row.find_element(*self.item_name)
-            names.append(name_el.text)
-        return names
-
-    @allure.step("Get items prices")
+        return [row.name for row in self.snapshot()]
+
+    @step("Get items prices")
     def get_item_prices(self):
-        items = self.driver.find_elements(*self.cart_items)
-        prices = []
-        for row in items:
-            price_el = row.find_element(*self.item_price)
-            prices.append(float(price_el.text.replace("$", "").strip()))
-        return prices
-
-    @allure.step("Get cart items count")
+        return [row.price for row in self.snapshot()]
+
+    @step("Get cart items count")
     def get_items_count(self) -> int:
         return len(self.driver.find_elements(*self.cart_items))
 
-    @allure.step("Remove item from cart by name: {name}")
+    @step("Remove item from cart by name: {name}")
     def remove_item_by_name(self, name: str, timeout: int = 8) -> bool:
         """Удаляет товар по имени. Возвращает True, если нашли и удалили."""
         # 1) Items' locator
@@ -64,11 +77,11 @@ class CartPage:
             f"[.//div[contains(@class,'inventory_item_name') and normalize-space()=\"{name}\"]]"
         )
 
-        wait = WebDriverWait(self.driver, timeout)
+        wait = Wait(self.driver, timeout)
 
         try:
             # making sure the row has appeared
-            row = wait.until(EC.presence_of_element_located(row_by_name))
+            row = wait.until(present(row_by_name))
         except TimeoutException:
             return False
 
@@ -79,38 +92,39 @@ class CartPage:
             btn = row.find_element(*self.btn_remove_in_item)
             # на всякий случай проскроллим, чтобы избежать перекрытий
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-            wait.until(EC.element_to_be_clickable(self.btn_remove_in_item))  # в пределах row обычно достаточно
+            wait.until(clickable(self.btn_remove_in_item))  # в пределах row обычно достаточно
             btn.click()
         except Exception:
             return False
 
         # 3) Waiting the row to disappear
         try:
-            wait.until(EC.invisibility_of_element_located(row_by_name))
+            wait.until(invisible(row_by_name))
             return True
         except TimeoutException:
             # fallback
             try:
-                wait.until(lambda d: len(d.find_elements(*self.cart_items)) == before - 1)
+                wait.until(count_is(self.cart_items, before - 1))
                 return True
             except TimeoutException:
                 return False
 
-    @allure.step("Go back to main page")
+    @step("Go back to main page")
     def continue_shopping(self):
         self.driver.find_element(*self.return_to_main).click()
 
-    @allure.step("Proceed to checkout")
+    @step("Proceed to checkout")
+    @page_perf
     def proceed_to_checkout(self, timeout: int = 12):
-        w = WebDriverWait(self.driver, timeout)
+        w = Wait(self.driver, timeout)
         if "cart" not in self.driver.current_url:
             try:
                 from src.pages.main_page import MainPage
                 MainPage(self.driver).open_cart(timeout=timeout)
             except Exception:
-                self.driver.get("https://www.saucedemo.com/cart.html")
+                self.driver.get(self.URL)
         # going on, click on checkout
-        btn = w.until(EC.presence_of_element_located(self.btn_checkout))
+        btn = w.until(present(self.btn_checkout))
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-        w.until(EC.element_to_be_clickable(self.btn_checkout)).click()
-        w.until(lambda d: "checkout-step-one" in d.current_url or "checkout-step-one.html" in d.current_url)
\ No newline at end of file
+        w.until(clickable(self.btn_checkout)).click()
+        w.until(url_contains("checkout-step-one", "checkout-step-one.html"))
\ No newline at end of file
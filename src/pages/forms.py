@@ -0,0 +1,43 @@
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.conditions import find_js, visible
+from src.utils.reporting import step
+from src.utils.waits import Wait
+
+# Native value setter + input/change events: React keeps its own value tracker on <input>,
+# so a plain `el.value = ...` would be ignored by the app state.
+_FILL_JS = """
+var elements = [__ELEMENTS__], values = arguments[0];
+var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+return elements.map(function (el, i) {
+    if (!el) return null;
+    setter.call(el, values[i]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return el.value;
+});
+"""
+
+
+def set_values(driver: WebDriver, fields: dict) -> dict:
+    """
+    Sets all {locator: value} fields in one execute_script and reads them back in the same call.
+    Returns the fields whose value did not stick (empty dict when everything is set).
+    """
+    locators = list(fields)
+    script = _FILL_JS.replace("__ELEMENTS__", ", ".join(find_js(loc) for loc in locators))
+    actual = driver.execute_script(script, [fields[loc] for loc in locators])
+    return {loc: fields[loc] for loc, value in zip(locators, actual) if value != fields[loc]}
+
+
+@step("Fill form in one script call")
+def fill_form(driver: WebDriver, page, mapping: dict[str, str], timeout: int = 10):
+    """
+    mapping: locator attribute of `page` -> value, e.g. {"username": "standard_user", "password": "..."}.
+    All values are set and verified in one execute_script; fields that did not take the value
+    fall back to the page's keystroke typing (`page._set_input`).
+    """
+    fields = {getattr(page, name): value for name, value in mapping.items()}
+    Wait(driver, timeout).until(visible(next(iter(fields))))
+    for locator, value in set_values(driver, fields).items():
+        page._set_input(locator, value, timeout)
@@ -1,13 +1,17 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import allure
+
+from src.pages.forms import fill_form
+from src.utils.conditions import clickable, present, url_contains, visible
+from src.utils.config import PageUrl
+from src.utils.perf import page_perf
+from src.utils.reporting import step
+from src.utils.waits import Wait
 
 class LoginPage:
-    URL = "https://www.saucedemo.com/"
+    URL = PageUrl("")
 
     def __init__(self, driver: WebDriver):
         self.driver = driver
@@ -16,13 +20,28 @@ class LoginPage:
         self.login_btn = (By.ID, "login-button")
         self.error = (By.CSS_SELECTOR, "[data-test='error']")  # h3 "Epic sadface: ..."
 
-    @allure.step("Open login page")
+    @step("Open login page")
+    @page_perf
     def open(self):
         self.driver.get(self.URL)
 
+    @step("Inject session (skip login form)")
+    def inject_session(self, user, landing: str | None = "inventory.html"):
+        """
+        Fast path for setup: one navigation to the site and one script that sets
+        the `session-username` cookie and (optionally) goes to `landing`.
+        Use the real form only in tests that cover authentication.
+        """
+        username = user["username"] if isinstance(user, dict) else user
+        self.driver.get(self.URL)
+        self.driver.execute_script("""
+            document.cookie = 'session-username=' + arguments[0] + '; path=/';
+            if (arguments[1]) window.location.assign(arguments[1]);
+        """, username, landing)
+
     def _set_input(self, locator, text: str, timeout: int = 10):
-        w = WebDriverWait(self.driver, timeout)
-        el = w.until(EC.visibility_of_element_located(locator))
+        w = Wait(self.driver, timeout)
+        el = w.until(visible(locator))
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
         el.click()
         el.send_keys(Keys.CONTROL, "a")
@@ -30,37 +49,40 @@ class LoginPage:
         if text:
             el.send_keys(text)
 
-    @allure.step("Fill credentials")
-    def fill_credentials(self, username: str, password: str):
+    @step("Fill credentials")
+    def fill_credentials(self, username: str, password: str, typing: bool = False):
+        if not typing:
+            fill_form(self.driver, self, {"username": username, "password": password})
+            return
         self._set_input(self.username, username)
         self._set_input(self.password, password)
 
-    @allure.step("Submit login form")
+    @step("Submit login form")
     def submit(self, timeout: int = 10):
-        w = WebDriverWait(self.driver, timeout)
-        btn = w.until(EC.presence_of_element_located(self.login_btn))
+        w = Wait(self.driver, timeout)
+        btn = w.until(present(self.login_btn))
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
         try:
-            w.until(EC.element_to_be_clickable(self.login_btn)).click()
+            w.until(clickable(self.login_btn)).click()
         except Exception:
             self.driver.execute_script("arguments[0].click();", btn)
 
 
-    @allure.step("Login (no implicit wait for result)")
-    def login(self, username: str, password: str):
-        """Login without waiting for inventory page"""
-        self.fill_credentials(username, password)
+    @step("Login (no implicit wait for result)")
+    def login(self, username: str, password: str, typing: bool = False):
+        """Login without waiting for inventory page (typing=True types the credentials key by key)"""
+        self.fill_credentials(username, password, typing)
         self.submit()
 
-    @allure.step("Wait login success (inventory)")
+    @step("Wait login success (inventory)")
     def wait_success(self, timeout: int = 10):
-        WebDriverWait(self.driver, timeout).until(EC.url_contains("inventory"))
+        Wait(self.driver, timeout).until(url_contains("inventory"))
 
-    @allure.step("Wait login error")
+    @step("Wait login error")
     def wait_error(self, timeout: int = 10) -> str | None:
-        w = WebDriverWait(self.driver, timeout)
+        w = Wait(self.driver, timeout)
         try:
-            el = w.until(EC.visibility_of_element_located(self.error))
+            el = w.until(visible(self.error))
             return el.text.strip()
         except TimeoutException:
             return None
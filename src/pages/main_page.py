@@ -1,13 +1,57 @@
+import uuid
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import allure
+
+from src.pages.snapshot import ItemRow, read_rows
+from src.utils.conditions import clickable, present, text_equals, url_contains
+from src.utils.config import PageUrl
+from src.utils.perf import page_perf
+from src.utils.reporting import step
+from src.utils.waits import Wait
+
+# name -> row position of every inventory item, built in one call. The index lives in `window`,
+# so a navigation drops it; a MutationObserver marks it dirty when rows are added/removed/re-sorted.
+_BUILD_INDEX_JS = """
+    var rows = document.querySelectorAll('.inventory_item'), names = [];
+    rows.forEach(function (row) {
+        var el = row.querySelector('.inventory_item_name');
+        names.push(el ? (el.innerText || '').trim() : '');
+    });
+    var idx = window.__inventoryIndex = {token: arguments[0], dirty: false};
+    var touchesRows = function (nodes) {
+        return Array.prototype.some.call(nodes, function (n) {
+            return n.nodeType === 1 && (n.classList.contains('inventory_item') || !!n.querySelector('.inventory_item'));
+        });
+    };
+    new MutationObserver(function (records) {
+        if (records.some(function (r) { return touchesRows(r.addedNodes) || touchesRows(r.removedNodes); })) idx.dirty = true;
+    }).observe(document.body, {childList: true, subtree: true});
+    return names;
+"""
+
+# clicks "Add to cart" of the given rows; null when the index is stale
+_ADD_JS = """
+    var idx = window.__inventoryIndex;
+    if (!idx || idx.token !== arguments[0] || idx.dirty) return null;
+    var rows = document.querySelectorAll('.inventory_item');
+    var badge = document.querySelector('.shopping_cart_badge');
+    var before = badge ? parseInt(badge.innerText, 10) || 0 : 0, clicked = 0;
+    arguments[1].forEach(function (i) {
+        var button = rows[i] && rows[i].querySelector('button');
+        // уже в корзине ("Remove") — не кликаем, иначе товар удалится
+        if (button && !/^remove/.test(button.id || '') && button.innerText.trim() !== 'Remove') {
+            button.click();
+            clicked++;
+        }
+    });
+    return {before: before, clicked: clicked};
+"""
 
 
 class MainPage:
 
-    URL = "https://www.saucedemo.com/inventory.html"
+    URL = PageUrl("inventory.html")
 
     def __init__(self, driver: WebDriver):
         self.driver = driver
@@ -18,42 +62,87 @@ class MainPage:
         self.cart_badge = (By.CLASS_NAME, "shopping_cart_badge")
         self.menu_button = (By.ID, "react-burger-menu-btn")
         self.logout_link = (By.ID, "logout_sidebar_link")
+        self._index_token: str | None = None
+        self._index: dict[str, int] = {}
 
-    @allure.step("Waiting inventory")
+    @step("Waiting inventory")
+    @page_perf
     def wait_until_loaded(self, timeout: int = 10):
         """Waiting for a least the first item to appear"""
-        WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(self.inventory_item)
-        )
+        Wait(self.driver, timeout).until(present(self.inventory_item))
 
-    @allure.step("Checking if we are on inventory page")
+    @step("Checking if we are on inventory page")
     def is_loaded(self) -> bool:
         return "inventory" in self.driver.current_url
 
-    @allure.step("Getting the full items list")
+    @step("Snapshot of inventory items")
+    def snapshot(self) -> list[ItemRow]:
+        """All inventory rows (name, price, description, button) in one round trip."""
+        return read_rows(self.driver, ".inventory_item")
+
+    @step("Getting the full items list")
     def get_item_names(self):
-        items = self.driver.find_elements(*self.item_name)
-        return [el.text for el in items]
-
-    @allure.step("Adding the item to cart")
-    def add_item_to_cart(self, name: str):
-        items = self.driver.find_elements(*self.inventory_item)
-        for item in items:
-            if name in item.text:
-                button = item.find_element(By.TAG_NAME, "button")
-                button.click()
-                return True
-        return False
-
-    @allure.step("Passing to the cart")
+        return [row.name for row in self.snapshot()]
+
+    def _build_index(self):
+        self._index_token = uuid.uuid4().hex
+        names = self.driver.execute_script(_BUILD_INDEX_JS, self._index_token)
+        # при одинаковых именах берём первую строку, как и раньше
+        self._index = {}
+        for i, name in enumerate(names):
+            self._index.setdefault(name, i)
+
+    def _click_add(self, names: list[str], attempts: int = 3) -> tuple[dict, list[str]]:
+        fresh = self._index_token is None
+        if fresh:
+            self._build_index()
+        for _ in range(attempts):
+            missing = [n for n in names if n not in self._index]
+            if missing and not fresh:
+                # имени нет в старом индексе — возможно, список уже другой
+                self._build_index()
+                fresh = True
+                missing = [n for n in names if n not in self._index]
+            rows = [self._index[n] for n in names if n in self._index]
+            if not rows:
+                return {"before": 0, "clicked": 0}, missing
+            result = self.driver.execute_script(_ADD_JS, self._index_token, rows)
+            if result is not None:
+                return result, missing
+            self._build_index()  # страница перезагрузилась или список перерисован
+            fresh = True
+        raise StaleElementReferenceException(
+            f"Inventory list kept changing while adding {names} ({attempts} index rebuilds)")
+
+    @step("Adding the item to cart")
+    def add_item_to_cart(self, name: str, timeout: int = 10) -> bool:
+        """
+        Exact name match, confirmed by the badge like add_items_to_cart.
+        True when the item is in the cart afterwards — also when it already was ("Remove"), then nothing is clicked.
+        """
+        return not self.add_items_to_cart([name], timeout)
+
+    @step("Adding items to cart: {names}")
+    def add_items_to_cart(self, names, timeout: int = 10) -> list[str]:
+        """
+        Clicks "Add to cart" of every named item in one script call and waits once for the badge.
+        Items already in the cart are skipped. Returns the names that are not on the page.
+        """
+        result, missing = self._click_add(list(names))
+        if result["clicked"]:
+            Wait(self.driver, timeout).until(text_equals(self.cart_badge, str(result["before"] + result["clicked"])))
+        return missing
+
+    @step("Passing to the cart")
+    @page_perf
     def open_cart(self, timeout: int = 12):
-        w = WebDriverWait(self.driver, timeout)
-        link = w.until(EC.presence_of_element_located(self.cart_link))
+        w = Wait(self.driver, timeout)
+        link = w.until(present(self.cart_link))
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", link)
-        w.until(EC.element_to_be_clickable(self.cart_link)).click()
-        w.until(lambda d: "cart" in d.current_url or "cart.html" in d.current_url)
+        w.until(clickable(self.cart_link)).click()
+        w.until(url_contains("cart", "cart.html"))
 
-    @allure.step("Checking the number of items")
+    @step("Checking the number of items")
     def get_cart_count(self) -> int:
         try:
             badge = self.driver.find_element(*self.cart_badge)
@@ -61,12 +150,10 @@ class MainPage:
         except Exception:
             return 0
 
-    @allure.step("Logging out")
+    @step("Logging out")
     def logout(self):
         self.driver.find_element(*self.menu_button).click()
-        WebDriverWait(self.driver, 5).until(
-            EC.element_to_be_clickable(self.logout_link)
-        )
+        Wait(self.driver, 5).until(clickable(self.logout_link))
         self.driver.find_element(*self.logout_link).click()
 
 
@@ -0,0 +1,258 @@
+"""
+Navigation planner: pages are nodes of a graph, edges are ways to move between them — UI clicks,
+direct URL loads and state shortcuts (session cookie, seeded cart) — each with the state it
+requires and produces. goto() runs Dijkstra over (page, logged in, cart ready, form submitted,
+cart empty) with measured edge costs, walks the cheapest valid path and checks the cart in storage:
+
+    step_2 = Navigator(driver).goto(CheckoutStepTwoPage, state=NavState(cart=ITEMS))
+
+Use it in tests that are not about navigation; tests of the transitions themselves keep clicking.
+"""
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.pages.cart_page import CartPage
+from src.pages.checkout_page import CheckoutCompletePage, CheckoutStepOnePage, CheckoutStepTwoPage
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.utils.config import base_url
+from src.utils.data import PRODUCTS, USER_INFO, VALID_USER
+from src.utils.reporting import step
+from src.utils.state_oracle import StateOracle
+
+START = "start"  # about:blank or another site
+
+
+@dataclass(frozen=True)
+class NavState:
+    """What the test needs at the target: the user, the cart and (optionally) submitted step-one info."""
+    user: dict = field(default_factory=lambda: VALID_USER)
+    cart: tuple[str, ...] = ()
+    info: dict | None = None  # not None — step-one form must really be submitted
+
+    def __post_init__(self):
+        object.__setattr__(self, "cart", tuple(self.cart))
+
+
+@dataclass(frozen=True)
+class Facts:
+    page: object  # page class or START
+    logged_in: bool
+    cart_ready: bool
+    info_submitted: bool
+    cart_empty: bool = False  # False — unknown or not empty (off-site storage can't be read)
+
+
+@dataclass(frozen=True)
+class Edge:
+    name: str
+    source: object  # page class, START, or None for "any page"
+    target: object
+    prior: float  # seconds, until measured
+    run: object  # run(driver, state)
+    needs_login: bool = True
+    needs_cart: bool = False
+    needs_empty_cart: bool = False  # UI "Add to cart" only adds, it can't drop foreign items
+    needs_site: bool = False  # storage/cookie edges need a page of the site origin
+    logs_in: bool = False
+    sets_cart: bool | None = None
+    sets_info: bool | None = None
+
+    def applies(self, facts: Facts, state: NavState) -> bool:
+        if self.source is not None and self.source != facts.page:
+            return False
+        if self.needs_site and facts.page == START:
+            return False
+        if self.needs_login and not facts.logged_in:
+            return False
+        if self.needs_empty_cart and not facts.cart_empty:
+            return False
+        return not (self.needs_cart and not facts.cart_ready)
+
+    def apply(self, facts: Facts) -> Facts:
+        return Facts(
+            page=self.target,
+            logged_in=facts.logged_in or self.logs_in,
+            cart_ready=facts.cart_ready if self.sets_cart is None else self.sets_cart,
+            info_submitted=(self.sets_info if self.sets_info is not None
+                            else facts.info_submitted and self.target is CheckoutStepTwoPage),
+            cart_empty=facts.cart_empty if self.sets_cart is None else not self.sets_cart,
+        )
+
+
+def _load(page):
+    def run(driver, state):
+        driver.get(page.URL)
+        _wait(driver, page)
+    return run
+
+
+def _wait(driver, page):
+    obj = page(driver)
+    if page is CheckoutCompletePage:
+        obj.is_loaded()
+    elif page is not LoginPage:
+        obj.wait_until_loaded()
+
+
+def _login_ui(driver, state):
+    LoginPage(driver).login(state.user["username"], state.user["password"])
+    MainPage(driver).wait_until_loaded()
+
+
+def _session(driver, state):
+    LoginPage(driver).inject_session(state.user)
+    MainPage(driver).wait_until_loaded()
+
+
+def _seed(driver, state):
+    cart = CartPage(driver)
+    cart.seed(state.cart)
+    cart.wait_until_loaded()
+
+
+def _add_ui(driver, state):
+    missing = MainPage(driver).add_items_to_cart(state.cart)
+    if missing:
+        raise ValueError(f"Not on the inventory page: {missing}")
+
+
+def _open_cart(driver, state):
+    MainPage(driver).open_cart()
+    CartPage(driver).wait_until_loaded()
+
+
+def _checkout(driver, state):
+    CartPage(driver).proceed_to_checkout()
+    CheckoutStepOnePage(driver).wait_until_loaded()
+
+
+def _submit_info(driver, state):
+    info = state.info or USER_INFO
+    step_1 = CheckoutStepOnePage(driver)
+    step_1.fill_in_the_form(info["first_name"], info["last_name"], info["postal_code"])
+    step_1.proceed_to_payment()
+    CheckoutStepTwoPage(driver).wait_until_loaded()
+
+
+def _finish(driver, state):
+    CheckoutStepTwoPage(driver).finish()
+    CheckoutCompletePage(driver).is_loaded()
+
+
+def _cancel(driver, state):
+    CheckoutStepTwoPage(driver).cancel()
+    MainPage(driver).wait_until_loaded()
+
+
+EDGES = [
+    Edge("load login", None, LoginPage, 1.0, _load(LoginPage), needs_login=False),
+    Edge("login form", LoginPage, MainPage, 2.0, _login_ui, needs_login=False, logs_in=True),
+    Edge("session cookie", None, MainPage, 1.2, _session, needs_login=False, logs_in=True),
+    Edge("load inventory", None, MainPage, 1.0, _load(MainPage)),
+    Edge("load cart", None, CartPage, 1.0, _load(CartPage)),
+    Edge("load step one", None, CheckoutStepOnePage, 1.0, _load(CheckoutStepOnePage)),
+    # SauceDemo не хранит данные формы: обзор открывается по URL, если корзина не пуста
+    Edge("load step two", None, CheckoutStepTwoPage, 1.0, _load(CheckoutStepTwoPage), needs_cart=True),
+    Edge("seed cart", None, CartPage, 1.2, _seed, needs_site=True, sets_cart=True),
+    Edge("add to cart", MainPage, MainPage, 0.6, _add_ui, needs_empty_cart=True, sets_cart=True),
+    Edge("open cart", MainPage, CartPage, 0.8, _open_cart),
+    Edge("checkout", CartPage, CheckoutStepOnePage, 0.8, _checkout),
+    Edge("submit info", CheckoutStepOnePage, CheckoutStepTwoPage, 1.5, _submit_info, needs_cart=True, sets_info=True),
+    Edge("finish", CheckoutStepTwoPage, CheckoutCompletePage, 0.8, _finish, needs_cart=True, sets_cart=False),
+    Edge("cancel", CheckoutStepTwoPage, MainPage, 0.8, _cancel),
+]
+
+
+class EdgeCosts:
+    """Exponentially weighted mean of measured edge durations, per worker process."""
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self.measured: dict[str, float] = {}
+
+    def cost(self, edge: Edge) -> float:
+        return self.measured.get(edge.name, edge.prior)
+
+    def record(self, edge: Edge, seconds: float):
+        old = self.measured.get(edge.name)
+        self.measured[edge.name] = seconds if old is None else old + self.alpha * (seconds - old)
+
+
+costs = EdgeCosts()
+
+_PAGES_BY_URL = [(CheckoutStepOnePage, "checkout-step-one"), (CheckoutStepTwoPage, "checkout-step-two"),
+                 (CheckoutCompletePage, "checkout-complete"), (CartPage, "cart"), (MainPage, "inventory")]
+
+
+class Navigator:
+    def __init__(self, driver: WebDriver, edges: list[Edge] = EDGES, edge_costs: EdgeCosts = costs):
+        self.driver = driver
+        self.edges = edges
+        self.costs = edge_costs
+
+    def where(self, state: NavState) -> Facts:
+        """Current page and state, read in one script call."""
+        now = StateOracle(self.driver).read()
+        if not now.url.startswith(base_url()):
+            return Facts(START, False, False, False)
+        path = now.url[len(base_url()):]
+        page = next((p for p, part in _PAGES_BY_URL if part in path), LoginPage)
+        wanted = sorted(PRODUCTS[name]["id"] for name in state.cart)
+        cart_ready = bool(wanted) and not now.unknown_ids and sorted(now.ids) == wanted
+        return Facts(page, now.user == state.user["username"], cart_ready, False,
+                     cart_empty=not now.count and not now.corrupt)
+
+    def plan(self, target, state: NavState, start: Facts) -> list[Edge] | None:
+        """Cheapest edge sequence from `start` to a goal state (Dijkstra)."""
+        def is_goal(f: Facts) -> bool:
+            # после finish корзина пуста — для страницы завершения её готовность не проверяем
+            return (f.page is target and (f.logged_in or target is LoginPage)
+                    and (f.cart_ready or not state.cart or target is CheckoutCompletePage)
+                    and (f.info_submitted or state.info is None))
+
+        counter = itertools.count()  # разрешение ничьих в куче без сравнения Facts
+        queue = [(0.0, next(counter), start, [])]
+        best = {start: 0.0}
+        while queue:
+            cost, _, facts, path = heapq.heappop(queue)
+            if is_goal(facts):
+                return path
+            if cost > best.get(facts, float("inf")):
+                continue
+            for edge in self.edges:
+                if (edge.sets_cart and not state.cart) or not edge.applies(facts, state):
+                    continue
+                nxt = edge.apply(facts)
+                new_cost = cost + self.costs.cost(edge)
+                if new_cost < best.get(nxt, float("inf")):
+                    best[nxt] = new_cost
+                    heapq.heappush(queue, (new_cost, next(counter), nxt, path + [edge]))
+        return None
+
+    def goto(self, target, state: NavState | None = None):
+        """Reach `target` (a page class) in `state` by the cheapest known path; returns the page object."""
+        state = state or NavState()
+        with step(f"Navigate to {target.__name__}"):
+            path = self.plan(target, state, self.where(state))
+            if path is None:
+                raise ValueError(f"No path to {target.__name__} for {state}")
+            for edge in path:
+                with step(f"{edge.name} → {edge.target.__name__}"):
+                    started = time.perf_counter()
+                    edge.run(self.driver, state)
+                    self.costs.record(edge, time.perf_counter() - started)
+            self._check_cart(target, state)
+        return target(self.driver)
+
+    def _check_cart(self, target, state: NavState):
+        """The cart in storage is exactly `state.cart` (after finish it is empty by design)."""
+        if not state.cart or target is CheckoutCompletePage:
+            return
+        now = StateOracle(self.driver).read()
+        if now.unknown_ids or sorted(now.ids) != sorted(PRODUCTS[name]["id"] for name in state.cart):
+            raise AssertionError(f"Cart after navigation: {sorted(now.names)} + {list(now.unknown_ids)}, "
+                                 f"expected {sorted(state.cart)}")
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@dataclass(frozen=True)
+class ItemRow:
+    """One product row as rendered on inventory, cart or checkout overview."""
+    name: str
+    price: float
+    description: str
+    button: str | None  # "Add to cart" / "Remove"; None where the row has no button
+
+
+# One execute_script for the whole list instead of 1 + N*fields find_element/.text calls.
+# innerText (not textContent) to match what WebElement.text returns for visible text.
+ROWS_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (row) {
+    function text(sel) { var el = row.querySelector(sel); return el ? el.innerText.trim() : ''; }
+    var btn = row.querySelector('button');
+    return {
+        name: text('.inventory_item_name'),
+        price: text('.inventory_item_price'),
+        description: text('.inventory_item_desc'),
+        button: btn ? btn.innerText.trim() : null
+    };
+});
+"""
+
+
+def parse_price(text: str) -> float:
+    return float(text.replace("$", "").strip()) if text else 0.0
+
+
+def read_rows(driver: WebDriver, row_css: str) -> list[ItemRow]:
+    raw = driver.execute_script(ROWS_JS, row_css) or []
+    return [
+        ItemRow(name=r["name"], price=parse_price(r["price"]), description=r["description"], button=r["button"])
+        for r in raw
+    ]
@@ -0,0 +1,204 @@
+"""
+Failure artifacts with bounded cost.
+
+Capture goes through CDP and is cheap for the test thread: Page.captureScreenshot as JPEG of the
+viewport (ARTIFACT_JPEG_QUALITY) and DOMSnapshot.captureSnapshot. Decoding, turning the snapshot
+into HTML and writing files happens in a background writer thread, overlapping with quit().
+UiTestCase attaches whatever is ready to Allure at the end of tearDown. Outside a test
+(load mode, benchmarks) nothing is captured: nobody would attach or clean it up.
+
+Limits per worker run, so a broken stand cannot fill the disk:
+  ARTIFACT_QUOTA        — max artifacts (default 50); after that nothing is captured at all
+  ARTIFACT_MAX_BYTES    — max size of one artifact (default 2 MB; DOM is truncated, images dropped)
+  ARTIFACT_TOTAL_BYTES  — max bytes written in total (default 200 MB)
+"""
+import atexit
+import base64
+import html
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from selenium.common.exceptions import WebDriverException
+import allure
+
+_VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+_RAW_TEXT = {"script", "style"}
+
+
+def _int_env(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+@dataclass
+class Artifact:
+    name: str
+    kind: str  # "screenshot" | "dom"
+    payload: object
+    path: Path | None = None
+    skipped: str | None = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+def snapshot_to_html(snapshot: dict) -> str:
+    """HTML of the main document from a DOMSnapshot.captureSnapshot result."""
+    strings = snapshot["strings"]
+    doc = snapshot["documents"][0]
+    nodes = doc["nodes"]
+    parents, types, names = nodes["parentIndex"], nodes["nodeType"], nodes["nodeName"]
+    values, attributes = nodes.get("nodeValue", []), nodes.get("attributes", [])
+
+    def s(index):
+        return strings[index] if index is not None and index >= 0 else ""
+
+    children: list[list[int]] = [[] for _ in parents]
+    for i, parent in enumerate(parents):
+        if parent >= 0:
+            children[parent].append(i)
+
+    out: list[str] = []
+    # обход без рекурсии: глубокий DOM не упрётся в лимит стека
+    stack: list[tuple[int, bool]] = [(0, False)]
+    while stack:
+        i, closing = stack.pop()
+        name = s(names[i]).lower()
+        if closing:
+            out.append(f"</{name}>")
+            continue
+        kind = types[i]
+        if kind == 1:  # element
+            attrs = attributes[i] if i < len(attributes) else []
+            pairs = "".join(f' {s(attrs[k])}="{html.escape(s(attrs[k + 1]))}"' for k in range(0, len(attrs) - 1, 2))
+            out.append(f"<{name}{pairs}>")
+            if name in _VOID:
+                continue
+            stack.append((i, True))
+        elif kind == 3:  # text
+            parent_name = s(names[parents[i]]).lower() if parents[i] >= 0 else ""
+            text = s(values[i]) if i < len(values) else ""
+            out.append(text if parent_name in _RAW_TEXT else html.escape(text, quote=False))
+            continue
+        elif kind == 8:
+            out.append(f"<!--{s(values[i]) if i < len(values) else ''}-->")
+            continue
+        elif kind == 10:
+            out.append(f"<!DOCTYPE {name}>")
+            continue
+        stack.extend((child, False) for child in reversed(children[i]))
+    return "".join(out)
+
+
+class Artifacts:
+    def __init__(self):
+        self.quota = _int_env("ARTIFACT_QUOTA", 50)
+        self.max_bytes = _int_env("ARTIFACT_MAX_BYTES", 2 * 1024 * 1024)
+        self.total_bytes = _int_env("ARTIFACT_TOTAL_BYTES", 200 * 1024 * 1024)
+        self.quality = _int_env("ARTIFACT_JPEG_QUALITY", 60)
+        self.captured = 0
+        self.written = 0
+        self.skipped = 0
+        self._pending: list[Artifact] = []
+        self._test_active = False  # только UiTestCase забирает _pending; вне теста не снимаем
+        self._queue: queue.Queue[Artifact] = queue.Queue()
+        self._dir: Path | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def begin_test(self):
+        """Called from UiTestCase.setUp: captures are queued until attach_pending() at the end of the test."""
+        self._test_active = True
+
+    def allowed(self) -> bool:
+        # вне теста (load.py, бенчмарки) приложить артефакт некому — не снимаем и не тратим квоту
+        return self._test_active and self.captured < self.quota and self.written < self.total_bytes
+
+    def screenshot(self, driver, name: str) -> bool:
+        """JPEG of the viewport; the base64 string is decoded by the writer."""
+        if not self.allowed():
+            return False
+        try:
+            data = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": self.quality})["data"]
+        except WebDriverException:
+            return False  # артефакт не должен подменять исходную ошибку теста
+        self._submit(Artifact(name, "screenshot", data))
+        return True
+
+    def dom(self, driver, name: str) -> bool:
+        """DOM of the main document (serialized to HTML off the test thread)."""
+        if not self.allowed():
+            return False
+        try:
+            snapshot = driver.execute_cdp_cmd("DOMSnapshot.captureSnapshot", {"computedStyles": []})
+        except WebDriverException:
+            return False
+        url = snapshot["documents"][0].get("documentURL") if snapshot.get("documents") else None
+        if isinstance(url, int):
+            url = snapshot["strings"][url]
+        self._submit(Artifact(f"{name} | url={url}" if url else name, "dom", snapshot))
+        return True
+
+    def _submit(self, artifact: Artifact):
+        with self._lock:
+            self.captured += 1
+            if self._thread is None:
+                self._dir = Path(tempfile.mkdtemp(prefix="artifacts-"))
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+            self._pending.append(artifact)
+        self._queue.put(artifact)
+
+    def _run(self):
+        while True:
+            artifact = self._queue.get()
+            try:
+                self._write(artifact)
+            except Exception as e:
+                artifact.skipped = f"{type(e).__name__}: {e}"
+            finally:
+                artifact.done.set()
+
+    def _write(self, artifact: Artifact):
+        if artifact.kind == "screenshot":
+            body, suffix = base64.b64decode(artifact.payload), ".jpg"
+            if len(body) > self.max_bytes:
+                artifact.skipped = f"screenshot is {len(body)} bytes > ARTIFACT_MAX_BYTES={self.max_bytes}"
+                return
+        else:
+            body, suffix = snapshot_to_html(artifact.payload).encode("utf-8"), ".html"
+            if len(body) > self.max_bytes:
+                body = body[:self.max_bytes] + b"\n<!-- truncated by ARTIFACT_MAX_BYTES -->"
+        if self.written + len(body) > self.total_bytes:
+            artifact.skipped = f"ARTIFACT_TOTAL_BYTES={self.total_bytes} reached"
+            return
+        self.written += len(body)
+        artifact.path = self._dir / f"{self.captured}-{id(artifact)}{suffix}"
+        artifact.path.write_bytes(body)
+
+    def attach_pending(self, timeout: float = 10):
+        """Wait for the writer and attach this test's artifacts to Allure; temp files are removed."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._test_active = False
+        for artifact in pending:
+            if not artifact.done.wait(timeout):
+                self.skipped += 1
+                continue
+            if artifact.path is None:
+                self.skipped += 1
+                allure.attach(artifact.skipped or "not written", f"{artifact.name} (skipped)",
+                              allure.attachment_type.TEXT)
+                continue
+            kind = allure.attachment_type.JPG if artifact.kind == "screenshot" else allure.attachment_type.HTML
+            allure.attach.file(str(artifact.path), name=artifact.name, attachment_type=kind)
+            artifact.path.unlink(missing_ok=True)
+
+    def close(self):
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+
+artifacts = Artifacts()
+atexit.register(artifacts.close)
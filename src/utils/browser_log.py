@@ -0,0 +1,154 @@
+"""
+Browser console, uncaught JS errors and failed requests, streamed over WebDriver BiDi.
+
+With BROWSER_LOG=true (default) sessions are created with BiDi enabled and subscribed once to
+`log.entryAdded` and (BROWSER_LOG_NETWORK, default true) `network.responseCompleted` /
+`network.fetchError`. Events are pushed by the browser over the session websocket — nothing is
+polled — and land in a bounded ring buffer per session (BROWSER_LOG_SIZE entries, default 200);
+only responses with status >= 400 and failed fetches are kept.
+
+UiTestCase clears the buffer in setUp, attaches it to Allure when the test fails and, with
+FAIL_ON_JS_ERRORS=true or @fail_on_js_errors, fails a passing test that had uncaught JS errors.
+"""
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from selenium.webdriver.common.bidi.common import command_builder
+from selenium.webdriver.remote.webdriver import WebDriver
+
+_LOG_EVENTS = ("log.entryAdded",)
+_NETWORK_EVENTS = ("network.responseCompleted", "network.fetchError")
+
+
+def browser_log_enabled() -> bool:
+    return os.getenv("BROWSER_LOG", "true").lower() == "true"
+
+
+def network_log_enabled() -> bool:
+    return os.getenv("BROWSER_LOG_NETWORK", "true").lower() == "true"
+
+
+def fail_on_js_errors_enabled() -> bool:
+    return os.getenv("FAIL_ON_JS_ERRORS", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class LogEntry:
+    kind: str  # "console" | "js-error" | "http" | "fetch-error"
+    level: str  # debug / info / warn / error
+    text: str
+    url: str | None = None
+    timestamp: float = 0.0  # epoch seconds
+
+    def __str__(self):
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.timestamp)) + f".{int(self.timestamp * 1000) % 1000:03d}"
+        where = f"  ({self.url})" if self.url else ""
+        return f"{stamp} [{self.kind}:{self.level}] {self.text}{where}"
+
+
+def _top_frame_url(params: dict) -> str | None:
+    frames = (params.get("stackTrace") or {}).get("callFrames") or []
+    if not frames:
+        return None
+    frame = frames[0]
+    return f"{frame.get('url')}:{frame.get('lineNumber', 0) + 1}:{frame.get('columnNumber', 0) + 1}"
+
+
+def entry_from_event(method: str, params: dict) -> LogEntry | None:
+    """LogEntry for a BiDi event, or None when the event is not worth keeping (successful responses)."""
+    stamp = params.get("timestamp", time.time() * 1000) / 1000
+    if method == "log.entryAdded":
+        kind = "js-error" if params.get("type") == "javascript" else "console"
+        return LogEntry(kind, params.get("level", "info"), params.get("text") or "", _top_frame_url(params), stamp)
+    request = params.get("request") or {}
+    if method == "network.fetchError":
+        return LogEntry("fetch-error", "error", f"{request.get('method', 'GET')} {params.get('errorText', '')}",
+                        request.get("url"), stamp)
+    if method == "network.responseCompleted":
+        response = params.get("response") or {}
+        status = response.get("status", 0)
+        if status < 400:
+            return None
+        return LogEntry("http", "error" if status >= 500 else "warn",
+                        f"{request.get('method', 'GET')} {status} {response.get('statusText', '')}".rstrip(),
+                        response.get("url") or request.get("url"), stamp)
+    return None
+
+
+class _Event:
+    """What WebSocketConnection.add_callback expects: the BiDi method name and a params decoder."""
+
+    def __init__(self, method: str):
+        self.event_class = method
+
+    def from_json(self, params: dict) -> dict:
+        return params
+
+
+class BrowserLog:
+    """Ring buffer of one session's log entries, filled from websocket callbacks."""
+
+    def __init__(self, size: int | None = None):
+        self.entries: deque[LogEntry] = deque(maxlen=size or int(os.getenv("BROWSER_LOG_SIZE", "200")))
+        self.dropped = 0  # вытеснено из буфера с последнего clear()
+        self._lock = threading.Lock()
+
+    def add(self, entry: LogEntry):
+        with self._lock:
+            if len(self.entries) == self.entries.maxlen:
+                self.dropped += 1
+            self.entries.append(entry)
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.dropped = 0
+
+    def snapshot(self) -> list[LogEntry]:
+        with self._lock:
+            return list(self.entries)
+
+    def js_errors(self) -> list[LogEntry]:
+        return [e for e in self.snapshot() if e.kind == "js-error"]
+
+    def render(self) -> str:
+        lines = [str(e) for e in self.snapshot()]
+        if self.dropped:
+            lines.insert(0, f"... {self.dropped} earlier entries dropped (BROWSER_LOG_SIZE)")
+        return "\n".join(lines)
+
+
+def attach(driver: WebDriver) -> BrowserLog | None:
+    """Subscribe the session once and return its buffer; None if the session has no BiDi."""
+    log = getattr(driver, "_browser_log", None)
+    if log is not None or not browser_log_enabled():
+        return log
+    try:
+        if not driver.caps.get("webSocketUrl"):
+            return None  # сессия создана без BiDi (например, чужие опции)
+        if driver._websocket_connection is None:
+            driver._start_bidi()  # websocket сессии, тот же, что у driver.script / driver.network
+        conn = driver._websocket_connection
+        log = BrowserLog()
+        events = _LOG_EVENTS + (_NETWORK_EVENTS if network_log_enabled() else ())
+        # execute + command_builder есть во всех версиях Selenium с BiDi (send_cmd — только в новых)
+        conn.execute(command_builder("session.subscribe", {"events": list(events)}))
+        # колбэки — только после удачной подписки, чтобы повторный attach не плодил дубли
+        for method in events:
+            def on_event(params, method=method):
+                entry = entry_from_event(method, params)
+                if entry is not None:
+                    log.add(entry)
+            conn.add_callback(_Event(method), on_event)
+    except Exception:
+        return None  # диагностика не должна ломать setUp, что бы ни случилось
+    driver._browser_log = log
+    return log
+
+
+def fail_on_js_errors(test):
+    """Test decorator: fail the test (after quit) if the page threw uncaught JS errors."""
+    test.fail_on_js_errors = True
+    return test
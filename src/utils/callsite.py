@@ -0,0 +1,16 @@
+import os
+import sys
+
+_PAGES_DIR = os.sep + os.path.join("src", "pages") + os.sep
+
+
+def page_call_site(skip: int = 1) -> tuple[str, str] | None:
+    """(PageClass, method) of the innermost page-object method on the current call stack."""
+    frame = sys._getframe(skip)
+    while frame is not None:
+        if _PAGES_DIR in frame.f_code.co_filename:
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return type(owner).__name__, frame.f_code.co_name
+        frame = frame.f_back
+    return None
@@ -0,0 +1,116 @@
+"""
+Browser-state checkpoints for multi-step scenarios (CHECKPOINTS, on by default).
+
+The first test that needs e.g. "cart with 4 items" runs its setup and the resulting state
+(cookies, localStorage, current URL) is saved under a name. Later tests of the same worker
+restore it in three commands instead of replaying the setup. If the restore does not verify
+(expired cookie, stand reset, ...), the setup is replayed and the checkpoint re-captured.
+
+Worth it only for setups that are expensive to replay (UI flows, server-side state): a setup that
+already injects cookies/localStorage costs the same as a restore. `verify` should check the
+state itself (e.g. cart ids via StateOracle) and fail fast, not just wait for a page.
+"""
+import os
+from dataclasses import dataclass
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.reporting import step
+
+
+def checkpoints_enabled() -> bool:
+    return os.getenv("CHECKPOINTS", "true").lower() == "true"
+
+
+# поля CookieParam, которые принимает Network.setCookies
+_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+_CAPTURE_JS = """
+    var storage = {};
+    for (var i = 0; i < window.localStorage.length; i++) {
+        var key = window.localStorage.key(i);
+        storage[key] = window.localStorage.getItem(key);
+    }
+    return {url: window.location.href, origin: window.location.origin, storage: storage};
+"""
+
+_RESTORE_JS = """
+    window.localStorage.clear();
+    var storage = arguments[0];
+    Object.keys(storage).forEach(function (key) { window.localStorage.setItem(key, storage[key]); });
+    window.location.assign(arguments[1]);
+"""
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    url: str
+    origin: str
+    cookies: tuple[dict, ...]
+    local_storage: dict[str, str]
+
+
+def capture(driver: WebDriver) -> Checkpoint:
+    page = driver.execute_script(_CAPTURE_JS)
+    # CDP also returns HttpOnly cookies, which document.cookie does not
+    cookies = driver.execute_cdp_cmd("Network.getCookies", {"urls": [page["origin"] + "/"]})["cookies"]
+    params = []
+    for cookie in cookies:
+        param = {k: cookie[k] for k in _COOKIE_FIELDS if k in cookie}
+        if cookie.get("session") or param.get("expires", -1) < 0:
+            param.pop("expires", None)
+        params.append(param)
+    return Checkpoint(url=page["url"], origin=page["origin"], cookies=tuple(params),
+                      local_storage=dict(page["storage"]))
+
+
+def restore(driver: WebDriver, checkpoint: Checkpoint):
+    """Cookies, then one page of the origin (localStorage is per origin), then the saved URL."""
+    if checkpoint.cookies:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": list(checkpoint.cookies)})
+    driver.get(checkpoint.origin + "/")
+    driver.execute_script(_RESTORE_JS, checkpoint.local_storage, checkpoint.url)
+
+
+class Checkpoints:
+    """Named checkpoints of one worker process."""
+
+    def __init__(self):
+        self._saved: dict[str, Checkpoint] = {}
+        self.restored = 0
+        self.replayed = 0
+
+    def use(self, name: str, driver: WebDriver, setup, verify):
+        """
+        Bring the browser to the state `name`: restore it if captured before, otherwise (or when
+        `verify(driver)` fails after the restore) run `setup(driver)` and capture the result.
+        `verify` waits for the expected page and raises on mismatch (WebDriverException / AssertionError).
+        """
+        saved = self._saved.get(name) if checkpoints_enabled() else None
+        if saved is not None:
+            try:
+                with step(f"Restore checkpoint: {name}"):
+                    restore(driver, saved)
+                    verify(driver)
+                self.restored += 1
+                return
+            except (WebDriverException, AssertionError):
+                # чекпоинт протух — забываем его и проходим настройку заново
+                self._saved.pop(name, None)
+
+        with step(f"Set up: {name}"):
+            setup(driver)
+            verify(driver)
+        self.replayed += 1
+        if checkpoints_enabled():
+            self._saved[name] = capture(driver)
+
+    def forget(self, name: str | None = None):
+        if name is None:
+            self._saved.clear()
+        else:
+            self._saved.pop(name, None)
+
+
+# pytest workers are separate processes, so each keeps its own checkpoints
+checkpoints = Checkpoints()
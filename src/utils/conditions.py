@@ -0,0 +1,183 @@
+"""
+Wait conditions evaluated inside the page.
+
+Each condition is a JS expression: a truthy value means "satisfied" and is returned to
+Python (DOM elements come back as WebElement). They are used by src.utils.waits.Wait
+in one execute_async_script, and are also plain callables `condition(driver)`, so they
+work with the classic WebDriverWait polling as well.
+"""
+import json
+from dataclasses import dataclass
+from typing import Any
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# visible ≈ WebElement.is_displayed(): rendered boxes, not visibility:hidden, not transparent
+_VISIBLE_JS = ("(function (el) { if (!el || !el.isConnected) return false;"
+               " var s = window.getComputedStyle(el);"
+               " return el.getClientRects().length > 0 && s.visibility !== 'hidden' && s.opacity !== '0'; })")
+
+
+def find_js(locator) -> str:
+    """JS expression returning the first element for a (By, value) locator, or null."""
+    by, value = locator
+    v = json.dumps(value)
+    if by == By.ID:
+        return f"document.getElementById({v})"
+    if by == By.CLASS_NAME:
+        return f"(document.getElementsByClassName({v})[0] || null)"
+    if by == By.CSS_SELECTOR:
+        return f"document.querySelector({v})"
+    if by == By.NAME:
+        return f"document.querySelector('[name=' + JSON.stringify({v}) + ']')"
+    if by == By.TAG_NAME:
+        return f"(document.getElementsByTagName({v})[0] || null)"
+    if by == By.XPATH:
+        return f"document.evaluate({v}, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+def find_all_js(locator) -> str:
+    """JS expression returning an array with all elements for a locator."""
+    by, value = locator
+    v = json.dumps(value)
+    if by == By.ID:
+        return f"Array.from(document.querySelectorAll('[id=' + JSON.stringify({v}) + ']'))"
+    if by == By.CLASS_NAME:
+        return f"Array.from(document.getElementsByClassName({v}))"
+    if by == By.CSS_SELECTOR:
+        return f"Array.from(document.querySelectorAll({v}))"
+    if by == By.NAME:
+        return f"Array.from(document.querySelectorAll('[name=' + JSON.stringify({v}) + ']'))"
+    if by == By.TAG_NAME:
+        return f"Array.from(document.getElementsByTagName({v}))"
+    if by == By.XPATH:
+        return (f"(function () {{ var r = document.evaluate({v}, document, null,"
+                f" XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null), out = [];"
+                f" for (var i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i)); return out; }})()")
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+class Condition:
+    def __init__(self, js: str, description: str, convert=None):
+        self.js = js
+        self.description = description
+        self._convert = convert
+
+    def result(self, value):
+        """Python-side view of a truthy in-page result (e.g. Match for any_of)."""
+        return self._convert(value) if self._convert and value else value
+
+    def __call__(self, driver: WebDriver):
+        # polling fallback: one execute_script per poll
+        return self.result(driver.execute_script(f"return ({self.js});"))
+
+    def __repr__(self):
+        return self.description
+
+
+def present(locator) -> Condition:
+    return Condition(find_js(locator), f"present{locator}")
+
+
+def visible(locator) -> Condition:
+    return Condition(
+        f"(function (el) {{ return {_VISIBLE_JS}(el) ? el : null; }})({find_js(locator)})",
+        f"visible{locator}",
+    )
+
+
+def clickable(locator) -> Condition:
+    return Condition(
+        f"(function (el) {{ return {_VISIBLE_JS}(el) && !el.disabled ? el : null; }})({find_js(locator)})",
+        f"clickable{locator}",
+    )
+
+
+def invisible(locator) -> Condition:
+    return Condition(f"!{_VISIBLE_JS}({find_js(locator)})", f"invisible{locator}")
+
+
+def url_contains(*parts: str) -> Condition:
+    """True when the current URL contains any of `parts`."""
+    return Condition(
+        f"{json.dumps(list(parts))}.some(function (p) {{ return window.location.href.indexOf(p) >= 0; }})",
+        f"url_contains{parts}",
+    )
+
+
+def value_equals(locator, text: str) -> Condition:
+    return Condition(
+        f"(function (el) {{ return !!el && (el.value || '').trim() === {json.dumps(text)}; }})({find_js(locator)})",
+        f"value_equals{locator}={text!r}",
+    )
+
+
+def text_equals(locator, text: str) -> Condition:
+    return Condition(
+        f"(function (el) {{ return !!el && (el.innerText || '').trim() === {json.dumps(text)}; }})({find_js(locator)})",
+        f"text_equals{locator}={text!r}",
+    )
+
+
+def has_value(locator) -> Condition:
+    return Condition(
+        f"(function (el) {{ return !!el && (el.value || '').trim().length > 0; }})({find_js(locator)})",
+        f"has_value{locator}",
+    )
+
+
+def count_is(locator, n: int) -> Condition:
+    return Condition(f"{find_all_js(locator)}.length === {int(n)}", f"count_is{locator}=={n}")
+
+
+def text_of(locator) -> Condition:
+    """Trimmed text of a visible element; not satisfied while hidden or empty."""
+    return Condition(
+        f"(function (el) {{ return {_VISIBLE_JS}(el) ? ((el.innerText || '').trim() || null) : null; }})"
+        f"({find_js(locator)})",
+        f"text_of{locator}",
+    )
+
+
+@dataclass(frozen=True)
+class Match:
+    """Which branch of any_of() held, with its value and text (element innerText or string value)."""
+    branch: str
+    value: Any
+    text: str | None
+
+
+def _branches(conditions, named) -> list[tuple[str, Condition]]:
+    return [(c.description, c) for c in conditions] + list(named.items())
+
+
+def any_of(*conditions: Condition, **named: Condition) -> Condition:
+    """
+    First satisfied branch, evaluated in one pass inside the page:
+
+        match = wait.until(any_of(step_two=url_contains("checkout-step-two"), error=text_of(error)))
+        if match.branch == "error": ...
+    """
+    branches = _branches(conditions, named)
+    fns = ", ".join(f"[{json.dumps(label)}, function () {{ return ({c.js}); }}]" for label, c in branches)
+    js = (f"(function () {{ var bs = [{fns}];"
+          f" for (var i = 0; i < bs.length; i++) {{ var v = bs[i][1]();"
+          f" if (v) return {{branch: bs[i][0], value: v,"
+          f" text: v instanceof Element ? (v.innerText || '').trim() : (typeof v === 'string' ? v : null)}}; }}"
+          f" return null; }})()")
+    return Condition(
+        js,
+        "any_of(" + " | ".join(label for label, _ in branches) + ")",
+        convert=lambda v: Match(branch=v["branch"], value=v["value"], text=v["text"]),
+    )
+
+
+def all_of(*conditions: Condition, **named: Condition) -> Condition:
+    """All branches hold at the same moment; the result is the list of their values."""
+    branches = _branches(conditions, named)
+    fns = ", ".join(f"function () {{ return ({c.js}); }}" for _, c in branches)
+    js = (f"(function () {{ var fs = [{fns}], out = [];"
+          f" for (var i = 0; i < fs.length; i++) {{ var v = fs[i](); if (!v) return null; out.push(v); }}"
+          f" return out; }})()")
+    return Condition(js, "all_of(" + " & ".join(label for label, _ in branches) + ")")
@@ -0,0 +1,26 @@
+import os
+
+DEFAULT_BASE_URL = "https://www.saucedemo.com/"
+
+
+def base_url() -> str:
+    """Site under test. BASE_URL switches the suite to another stand (e.g. the local fixture site)."""
+    url = os.getenv("BASE_URL", DEFAULT_BASE_URL)
+    return url if url.endswith("/") else url + "/"
+
+
+def url(path: str = "") -> str:
+    return base_url() + path.lstrip("/")
+
+
+class PageUrl:
+    """
+    Page URL as a class attribute, resolved against BASE_URL on every access —
+    the fixture server sets BASE_URL after the page modules are already imported.
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = path
+
+    def __get__(self, obj, owner) -> str:
+        return url(self.path)
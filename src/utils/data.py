@@ -3,3 +3,13 @@ VALID_USER = {"username": "standard_user", "password": "secret_sauce"}
 LOCKED_USER = {"username": "locked_out_user", "password": "secret_sauce"}
 INVALID_USER = {"username": "standard_user", "password": "wrong_password"}
 USER_INFO = {"first_name": "John", "last_name": "Doe", "postal_code": "12345"}
+
+# SauceDemo catalog: name -> id used in the `cart-contents` localStorage key
+PRODUCTS = {
+    "Sauce Labs Backpack": {"id": 4, "price": 29.99},
+    "Sauce Labs Bike Light": {"id": 0, "price": 9.99},
+    "Sauce Labs Bolt T-Shirt": {"id": 1, "price": 15.99},
+    "Sauce Labs Fleece Jacket": {"id": 5, "price": 49.99},
+    "Sauce Labs Onesie": {"id": 2, "price": 7.99},
+    "Test.allTheThings() T-Shirt (Red)": {"id": 3, "price": 15.99},
+}
@@ -0,0 +1,121 @@
+import os
+import shutil
+import tempfile
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.browser_log import browser_log_enabled
+from src.utils.driver_service import get_shared, shared_service_enabled
+from src.utils.network_profile import apply_network_profile
+
+
+def is_headless() -> bool:
+    return os.getenv("HEADLESS", "true").lower() == "true"
+
+
+def build_options(profile_dir: str | None = None) -> Options:
+    """Chrome options shared by every session (per-test or pooled); `profile_dir` — its own --user-data-dir."""
+    headless = is_headless()
+
+    opts = Options()
+
+    # 🔒 disable password manager / save-password bubble / autofill / onboarding
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "autofill.profile_enabled": False,
+        "autofill.credit_card_enabled": False,
+        # иногда помогает отключение подсказок по логинам:
+        "credentials_enable_autosignin": False,
+    }
+    opts.add_experimental_option("prefs", prefs)
+    opts.add_argument("--incognito")  # чистый профиль без сохранённых паролей
+    opts.add_argument("--no-first-run")
+    opts.add_argument("--no-default-browser-check")
+    opts.add_argument("--disable-notifications")
+    opts.add_argument("--disable-popup-blocking")
+    # ключевые фичи Chrome, отключающие подсказки/онбординги
+    opts.add_argument(
+        "--disable-features=Autofill,AutofillServerCommunication,AutofillTypeSpecificFeatures,PasswordManagerOnboarding,AccountConsistency,PrivacySandboxSettings4")
+
+    # универсальные флаги
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+
+    # BiDi: консоль, JS-ошибки и упавшие запросы приходят событиями (BROWSER_LOG)
+    if browser_log_enabled():
+        opts.enable_bidi = True
+
+    # параллельный режим: у каждой сессии свой профиль Chrome (см. _session_profile)
+    if profile_dir:
+        opts.add_argument(f"--user-data-dir={profile_dir}")
+
+    if headless:
+        # Новый движок headless у Chromium
+        opts.add_argument("--headless=new")
+        # фиксированный и достаточно большой вьюпорт
+        opts.add_argument("--window-size=1920,1080")
+        # мелкие «анти-флейк» тюнинги
+        opts.add_argument("--force-device-scale-factor=1")
+        opts.add_argument("--hide-scrollbars")
+        opts.add_argument("--disable-dev-shm-usage")
+    else:
+        # видимый режим
+        opts.add_argument("--start-maximized")
+        opts.add_argument("--window-size=1600,1000")
+
+    return opts
+
+
+def _session_profile() -> str | None:
+    """Fresh --user-data-dir under CHROME_PROFILE_DIR: one Chrome profile can't be opened by two sessions
+    (the worker's current one and the pre-warmed next one, DRIVER_PREWARM)."""
+    root = os.getenv("CHROME_PROFILE_DIR")
+    if not root:
+        return None
+    os.makedirs(root, exist_ok=True)
+    return tempfile.mkdtemp(prefix="session-", dir=root)
+
+
+def _remove_profile_on_quit(driver: WebDriver, profile_dir: str):
+    quit_session = driver.quit
+
+    def quit():
+        try:
+            quit_session()
+        finally:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+    driver.quit = quit
+
+
+def create_driver() -> WebDriver:
+    profile_dir = _session_profile()
+    try:
+        if shared_service_enabled():
+            driver = _create_on_shared_service(profile_dir)
+        else:
+            driver = webdriver.Chrome(options=build_options(profile_dir))
+    except Exception:
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
+    if profile_dir:
+        _remove_profile_on_quit(driver, profile_dir)
+    driver.set_page_load_timeout(30)
+    driver.implicitly_wait(0)  # всегда только явные ожидания
+    apply_network_profile(driver)
+    return driver
+
+
+def _create_on_shared_service(profile_dir: str | None = None) -> WebDriver:
+    service, connections = get_shared()
+    opts = build_options(profile_dir)
+    if service.browser_path:
+        # после первой сессии Selenium Manager не вызывается — путь к Chrome запоминаем сами
+        opts.binary_location = service.browser_path
+    driver = webdriver.Chrome(service=service, options=opts)
+    service.browser_path = service.browser_path or opts.binary_location or None
+    connections.attach(driver)
+    return driver
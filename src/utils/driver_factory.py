@@ -0,0 +1,94 @@
+"""
+Pre-warmed driver factory (DRIVER_PREWARM=N): a background thread keeps N fully started
+Chrome sessions ready, so setUp takes one instead of blocking on webdriver.Chrome(...).
+The next session is launched while the current test runs (and mostly waits on the network).
+"""
+import atexit
+import os
+import threading
+from collections import deque
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.driver import create_driver
+
+
+def prewarm_count() -> int:
+    return int(os.getenv("DRIVER_PREWARM", "0"))
+
+
+def startup_stats_enabled() -> bool:
+    return os.getenv("STARTUP_STATS", "false").lower() == "true"
+
+
+# driver acquire time (pool / prewarm / new Chrome) of every test in this process, seconds; STARTUP_STATS only
+startup_times: list[float] = []
+
+
+class PrewarmedFactory:
+    def __init__(self, ready: int = 1, factory=create_driver):
+        self.ready = ready
+        self.factory = factory
+        self._drivers: deque[WebDriver] = deque()
+        self._error: Exception | None = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._fill, name="driver-prewarm", daemon=True)
+        self._thread.start()
+
+    def _fill(self):
+        while True:
+            with self._cond:
+                while not self._closed and len(self._drivers) >= self.ready:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            try:
+                driver = self.factory()
+            except Exception as e:
+                # отдаём ошибку в get(), иначе setUp будет ждать вечно
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                if self._closed:
+                    driver.quit()
+                    return
+                self._drivers.append(driver)
+                self._cond.notify_all()
+
+    def get(self) -> WebDriver:
+        with self._cond:
+            while not self._drivers and self._error is None:
+                self._cond.wait()
+            if not self._drivers:
+                raise self._error
+            driver = self._drivers.popleft()
+            self._cond.notify_all()  # фоновый поток сразу запускает следующий Chrome
+            return driver
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            drivers, self._drivers = list(self._drivers), deque()
+            self._cond.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+_factory: PrewarmedFactory | None = None
+
+
+def new_driver() -> WebDriver:
+    """A ready session from the pre-warmed factory, or a fresh Chrome when DRIVER_PREWARM is off."""
+    global _factory
+    ready = prewarm_count()
+    if ready <= 0:
+        return create_driver()
+    if _factory is None:
+        _factory = PrewarmedFactory(ready=ready)
+        atexit.register(_factory.close)
+    return _factory.get()
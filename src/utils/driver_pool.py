@@ -0,0 +1,80 @@
+import atexit
+import os
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.driver_factory import new_driver
+
+
+def pool_enabled() -> bool:
+    return os.getenv("DRIVER_POOL", "false").lower() == "true"
+
+
+def reset_session(driver: WebDriver):
+    """Bring a used session back to a clean state: no cookies, no storage, blank tab."""
+    # storage is only reachable from the page's own origin, so clear it before leaving
+    if driver.current_url.startswith("http"):
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    # CDP clears cookies of every origin, not only the current one
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """
+    Warm Chrome sessions kept per worker process.
+    A session goes back to the pool after reset and is recycled (quit) after
+    `max_uses` tests, after a failed test or when the reset itself fails.
+    """
+
+    def __init__(self, size: int = 2, max_uses: int = 20, factory=new_driver):
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory
+        self._idle: list[WebDriver] = []
+        self._uses: dict[str, int] = {}
+
+    def acquire(self) -> WebDriver:
+        if self._idle:
+            return self._idle.pop()
+        driver = self.factory()
+        self._uses[driver.session_id] = 0
+        return driver
+
+    def release(self, driver: WebDriver, failed: bool = False):
+        uses = self._uses.get(driver.session_id, 0) + 1
+        self._uses[driver.session_id] = uses
+        if failed or uses >= self.max_uses or len(self._idle) >= self.size:
+            self._discard(driver)
+            return
+        try:
+            reset_session(driver)
+        except Exception:
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    def _discard(self, driver: WebDriver):
+        self._uses.pop(driver.session_id, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        while self._idle:
+            self._discard(self._idle.pop())
+
+
+_pool: DriverPool | None = None
+
+
+def get_pool() -> DriverPool:
+    """One pool per process, so every pytest worker keeps its own sessions."""
+    global _pool
+    if _pool is None:
+        _pool = DriverPool(
+            size=int(os.getenv("DRIVER_POOL_SIZE", "2")),
+            max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", "20")),
+        )
+        atexit.register(_pool.close)
+    return _pool
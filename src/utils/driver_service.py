@@ -0,0 +1,113 @@
+"""
+Shared chromedriver (SHARED_DRIVER_SERVICE=true): one chromedriver process per worker serves
+every session the worker creates, and all sessions talk to it through one keep-alive
+connection pool sized for the worker's concurrency (DRIVER_HTTP_POOL_SIZE).
+Saves a process spawn and a TCP/HTTP setup per test and bounds file descriptors per host.
+"""
+import atexit
+import os
+import threading
+import urllib3
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def shared_service_enabled() -> bool:
+    return os.getenv("SHARED_DRIVER_SERVICE", "false").lower() == "true"
+
+
+def http_pool_size() -> int:
+    # одновременно живые сессии воркера: активная + пул + прогретые + запас
+    default = 2 + int(os.getenv("DRIVER_POOL_SIZE", "2")) + int(os.getenv("DRIVER_PREWARM", "0"))
+    return int(os.getenv("DRIVER_HTTP_POOL_SIZE", str(default)))
+
+
+class SharedService(Service):
+    """
+    start() is idempotent and stop() is a no-op: webdriver.Chrome starts/stops its service for
+    every session, but this one lives for the whole worker. shutdown() really stops it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.launches = 0
+        self.browser_path: str | None = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self.process is not None and self.process.poll() is None:
+                return
+            self.launches += 1
+            super().start()
+
+    def stop(self):
+        pass
+
+    def shutdown(self):
+        super().stop()
+
+
+class SharedConnections:
+    def __init__(self, size: int):
+        self.size = size
+        self.manager = urllib3.PoolManager(num_pools=4, maxsize=size, block=False, timeout=120)
+        self.sessions = 0
+
+    def attach(self, driver: WebDriver):
+        """Route the driver's HTTP commands through the shared keep-alive pool."""
+        executor = driver.command_executor
+        own = getattr(executor, "_conn", None)
+        if own is not None:
+            own.clear()  # пул, через который прошёл только newSession
+        executor._conn = self.manager
+        # quit() закрывает пул исполнителя — общий пул должен пережить сессию
+        executor.close = lambda: None
+        self.sessions += 1
+
+    def metrics(self) -> dict:
+        connections = requests = 0
+        for key in list(self.manager.pools.keys()):
+            pool = self.manager.pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests += pool.num_requests
+        return {
+            "pool_maxsize": self.size,
+            "sessions": self.sessions,
+            "connections_opened": connections,
+            "requests": requests,
+            "connection_reuse": 1 - connections / requests if requests else 0.0,
+        }
+
+
+_service: SharedService | None = None
+_connections: SharedConnections | None = None
+_lock = threading.Lock()
+
+
+def get_shared() -> tuple[SharedService, SharedConnections]:
+    global _service, _connections
+    with _lock:
+        if _service is None:
+            _service = SharedService()
+            _connections = SharedConnections(http_pool_size())
+        return _service, _connections
+
+
+@atexit.register
+def _shutdown():
+    # registered at import, so it runs after the pool/pre-warm factories have quit their sessions
+    if _service is not None:
+        _service.shutdown()
+
+
+def service_metrics() -> dict:
+    if _service is None:
+        return {"driver_processes": 0}
+    alive = _service.process is not None and _service.process.poll() is None
+    return {
+        "driver_processes": _service.launches,
+        "driver_process_alive": alive,
+        **_connections.metrics(),
+    }
@@ -0,0 +1,117 @@
+"""
+Local stand-in for saucedemo.com: serves the static clone in fixture_site/ on a free port.
+
+    uv run python -m src.utils.fixture_server --port 8000   # manual debugging
+    LOCAL_SITE=true uv run pytest                           # whole suite offline
+
+Large catalogs: every page is also served under /n/<size>/ with a generated catalog of <size>
+products (the six real ones with their ids, then synthetic ones), e.g. /n/10000/inventory.html.
+--catalog-size / FixtureServer(catalog_size=...) changes the catalog at the root.
+"""
+import argparse
+import json
+import os
+import re
+import threading
+from functools import lru_cache, partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SITE_DIR = Path(__file__).with_name("fixture_site")
+
+
+def local_site_enabled() -> bool:
+    return os.getenv("LOCAL_SITE", "false").lower() == "true"
+
+
+_SIZED = re.compile(r"^/n/(\d+)(/.*)$")
+
+
+def synthetic_name(i: int, size: int) -> str:
+    # одинаковая ширина номера: ни одно имя не является подстрокой другого
+    return f"Synthetic Item {i:0{len(str(size))}d}"
+
+
+_PRODUCT_JS = re.compile(r'\{id: (\d+), name: "(.*?)", price: ([\d.]+),\s*desc: "(.*?)"\}', re.S)
+
+
+def catalog(size: int) -> list[dict]:
+    """The six SauceDemo products (ids 0-5) followed by synthetic ones, `size` in total."""
+    real = [{"id": int(i), "name": name, "price": float(price), "desc": desc}
+            for i, name, price, desc in _PRODUCT_JS.findall((SITE_DIR / "catalog.js").read_text(encoding="utf-8"))]
+    items = real[:size]
+    for i in range(len(items), size):
+        items.append({"id": i, "name": synthetic_name(i, size), "price": round(1.99 + (i * 37) % 9000 / 100, 2),
+                      "desc": f"Generated product #{i} for scaling tests."})
+    return items
+
+
+@lru_cache(maxsize=8)
+def catalog_js(size: int) -> bytes:
+    return f"// Generated catalog: {size} products\nwindow.CATALOG = {json.dumps(catalog(size))};\n".encode("utf-8")
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # тихий сервер, не засоряем вывод pytest
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        size = self.server.catalog_size
+        sized = _SIZED.match(path)
+        if sized:
+            size, path = int(sized.group(1)), sized.group(2)
+            self.path = path
+        if path == "/catalog.js" and size is not None:
+            body = catalog_js(size)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/javascript; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        super().do_GET()
+
+
+class FixtureServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, catalog_size: int | None = None):
+        handler = partial(_Handler, directory=str(SITE_DIR))
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.catalog_size = catalog_size
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fixture-server", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def sized_url(self, size: int) -> str:
+        """Base URL of the same site with a generated catalog of `size` products."""
+        return f"{self.url}n/{size}/"
+
+    def start(self) -> "FixtureServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--catalog-size", type=int, help="generated catalog at the root instead of the six products")
+    args = parser.parse_args()
+    server = FixtureServer(args.host, args.port, args.catalog_size)
+    print(f"Serving {SITE_DIR} at {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
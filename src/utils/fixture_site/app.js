@@ -0,0 +1,293 @@
+// Offline stand-in for www.saucedemo.com: same URLs, ids, classes, data-test attributes,
+// texts and storage keys (`session-username` cookie, `cart-contents` localStorage).
+(function () {
+  "use strict";
+
+  var USERS = ["standard_user", "locked_out_user", "problem_user",
+               "performance_glitch_user", "error_user", "visual_user"];
+  var PASSWORD = "secret_sauce";
+  var TAX_RATE = 0.08;
+
+  var byId = {};
+  window.CATALOG.forEach(function (p) { byId[p.id] = p; });
+
+  // ---- state ----
+  function getUser() {
+    var m = document.cookie.match(/(?:^|;\s*)session-username=([^;]*)/);
+    return m ? decodeURIComponent(m[1]) : null;
+  }
+  function setUser(name) {
+    document.cookie = name
+      ? "session-username=" + encodeURIComponent(name) + "; path=/"
+      : "session-username=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+  }
+  function getCart() {
+    try { return JSON.parse(window.localStorage.getItem("cart-contents")) || []; }
+    catch (e) { return []; }
+  }
+  function setCart(ids) {
+    if (ids.length) window.localStorage.setItem("cart-contents", JSON.stringify(ids));
+    else window.localStorage.removeItem("cart-contents");
+  }
+  function slug(name) { return name.toLowerCase().replace(/\s+/g, "-"); }
+  function money(v) { return "$" + v.toFixed(2); }
+  function go(path) { window.location.assign(path); }
+
+  // ---- tiny DOM helper ----
+  function h(tag, attrs, children) {
+    var el = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (k) {
+      if (k === "text") el.textContent = attrs[k];
+      else if (k === "onclick") el.addEventListener("click", attrs[k]);
+      else el.setAttribute(k, attrs[k]);
+    });
+    (children || []).forEach(function (c) { if (c) el.appendChild(c); });
+    return el;
+  }
+
+  function showError(container, text) {
+    container.className = "error-message-container error";
+    container.innerHTML = "";
+    container.appendChild(h("h3", {"data-test": "error"}, [
+      h("button", {"class": "error-button", "data-test": "error-button", type: "button",
+                   onclick: function () { container.className = "error-message-container"; container.innerHTML = ""; }}),
+      document.createTextNode(text)
+    ]));
+  }
+
+  // ---- shared header (burger menu + cart link) ----
+  function header(title) {
+    var menu = h("div", {"class": "bm-menu-wrap"}, [
+      h("nav", {"class": "bm-item-list"}, [
+        h("a", {id: "inventory_sidebar_link", "class": "bm-item menu-item", href: "inventory.html", text: "All Items"}),
+        h("a", {id: "logout_sidebar_link", "class": "bm-item menu-item", href: "#", text: "Logout",
+                onclick: function (e) { e.preventDefault(); setUser(null); go("./"); }}),
+        h("a", {id: "reset_sidebar_link", "class": "bm-item menu-item", href: "#", text: "Reset App State",
+                onclick: function (e) { e.preventDefault(); setCart([]); renderBadge(); }})
+      ])
+    ]);
+    var cartLink = h("a", {"class": "shopping_cart_link", "data-test": "shopping-cart-link",
+                           onclick: function () { go("cart.html"); }});
+    return h("div", {id: "header_container", "class": "header_container"}, [
+      h("div", {id: "menu_button_container"}, [
+        h("button", {id: "react-burger-menu-btn", type: "button", text: "Open Menu",
+                     onclick: function () { menu.classList.add("open"); }}),
+        menu
+      ]),
+      h("div", {"class": "app_logo", text: "Swag Labs"}),
+      h("div", {id: "shopping_cart_container", "class": "shopping_cart_container"}, [cartLink]),
+      h("span", {"class": "title", "data-test": "title", text: title})
+    ]);
+  }
+
+  function renderBadge() {
+    var link = document.querySelector(".shopping_cart_link");
+    if (!link) return;
+    var badge = link.querySelector(".shopping_cart_badge");
+    var n = getCart().length;
+    if (!n) { if (badge) badge.remove(); return; }
+    if (!badge) { badge = h("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge"}); link.appendChild(badge); }
+    badge.textContent = String(n);
+  }
+
+  function itemLabel(p) {
+    return [
+      h("a", {id: "item_" + p.id + "_title_link", href: "#"}, [
+        h("div", {"class": "inventory_item_name", "data-test": "inventory-item-name", text: p.name})
+      ]),
+      h("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc", text: p.desc})
+    ];
+  }
+
+  // ---- pages ----
+  var pages = {};
+
+  pages.login = function (root) {
+    var user = h("input", {"class": "input_error form_input", placeholder: "Username", type: "text",
+                           "data-test": "username", id: "user-name", name: "user-name", autocorrect: "off", autocapitalize: "none"});
+    var pass = h("input", {"class": "input_error form_input", placeholder: "Password", type: "password",
+                           "data-test": "password", id: "password", name: "password", autocorrect: "off", autocapitalize: "none"});
+    var error = h("div", {"class": "error-message-container"});
+    var form = h("form", {}, [
+      h("div", {"class": "form_group"}, [user]),
+      h("div", {"class": "form_group"}, [pass]),
+      error,
+      h("input", {type: "submit", "class": "submit-button btn_action", "data-test": "login-button",
+                  id: "login-button", name: "login-button", value: "Login"})
+    ]);
+    form.addEventListener("submit", function (e) {
+      e.preventDefault();
+      var u = user.value, p = pass.value;
+      if (!u) return showError(error, "Epic sadface: Username is required");
+      if (!p) return showError(error, "Epic sadface: Password is required");
+      if (USERS.indexOf(u) < 0 || p !== PASSWORD)
+        return showError(error, "Epic sadface: Username and password do not match any user in this service");
+      if (u === "locked_out_user") return showError(error, "Epic sadface: Sorry, this user has been locked out.");
+      setUser(u);
+      go("inventory.html");
+    });
+    root.appendChild(h("div", {"class": "login_wrapper"}, [
+      h("div", {"class": "login_logo", text: "Swag Labs"}),
+      h("div", {id: "login_button_container", "class": "form_column"}, [h("div", {"class": "login-box"}, [form])])
+    ]));
+    var denied = window.sessionStorage.getItem("fixture-denied");
+    if (denied) {
+      window.sessionStorage.removeItem("fixture-denied");
+      showError(error, "Epic sadface: You can only access '" + denied + "' when you are logged in.");
+    }
+  };
+
+  pages.inventory = function (root) {
+    root.appendChild(header("Products"));
+    var cart = getCart();
+    var list = h("div", {"class": "inventory_list", "data-test": "inventory-list"});
+    window.CATALOG.forEach(function (p) {
+      var button = h("button", {"class": "btn btn_small btn_inventory", type: "button"});
+      function paint(inCart) {
+        button.id = (inCart ? "remove-" : "add-to-cart-") + slug(p.name);
+        button.setAttribute("name", button.id);
+        button.setAttribute("data-test", button.id);
+        button.className = "btn " + (inCart ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory";
+        button.textContent = inCart ? "Remove" : "Add to cart";
+      }
+      paint(cart.indexOf(p.id) >= 0);
+      button.addEventListener("click", function () {
+        var ids = getCart(), i = ids.indexOf(p.id);
+        if (i >= 0) ids.splice(i, 1); else ids.push(p.id);
+        setCart(ids);
+        paint(i < 0);
+        renderBadge();
+      });
+      list.appendChild(h("div", {"class": "inventory_item", "data-test": "inventory-item"}, [
+        h("div", {"class": "inventory_item_description"}, [
+          h("div", {"class": "inventory_item_label"}, itemLabel(p)),
+          h("div", {"class": "pricebar"}, [
+            h("div", {"class": "inventory_item_price", "data-test": "inventory-item-price", text: money(p.price)}),
+            button
+          ])
+        ])
+      ]));
+    });
+    root.appendChild(h("div", {id: "inventory_container"}, [list]));
+    renderBadge();
+  };
+
+  function cartRows(withRemove) {
+    var list = h("div", {"class": "cart_list", "data-test": "cart-list"}, [
+      h("div", {"class": "cart_quantity_label", text: "QTY"}),
+      h("div", {"class": "cart_desc_label", text: "Description"})
+    ]);
+    getCart().forEach(function (id) {
+      var p = byId[id];
+      if (!p) return;
+      var row = h("div", {"class": "cart_item", "data-test": "inventory-item"});
+      var remove = withRemove && h("button", {"class": "btn btn_secondary btn_small cart_button", type: "button",
+                                              id: "remove-" + slug(p.name), name: "remove-" + slug(p.name),
+                                              "data-test": "remove-" + slug(p.name), text: "Remove",
+                                              onclick: function () {
+                                                setCart(getCart().filter(function (x) { return x !== id; }));
+                                                row.remove();
+                                                renderBadge();
+                                              }});
+      row.appendChild(h("div", {"class": "cart_quantity", "data-test": "item-quantity", text: "1"}));
+      row.appendChild(h("div", {"class": "cart_item_label"}, itemLabel(p).concat([
+        h("div", {"class": "item_pricebar"}, [
+          h("div", {"class": "inventory_item_price", "data-test": "inventory-item-price", text: money(p.price)}),
+          remove
+        ])
+      ])));
+      list.appendChild(row);
+    });
+    return list;
+  }
+
+  pages.cart = function (root) {
+    root.appendChild(header("Your Cart"));
+    root.appendChild(h("div", {id: "cart_contents_container"}, [
+      cartRows(true),
+      h("div", {"class": "cart_footer"}, [
+        h("button", {id: "continue-shopping", "class": "btn btn_secondary back btn_medium", "data-test": "continue-shopping",
+                     type: "button", text: "Continue Shopping", onclick: function () { go("inventory.html"); }}),
+        h("button", {id: "checkout", "class": "btn btn_action btn_medium checkout_button", "data-test": "checkout",
+                     type: "button", text: "Checkout", onclick: function () { go("checkout-step-one.html"); }})
+      ])
+    ]));
+    renderBadge();
+  };
+
+  pages["checkout-step-one"] = function (root) {
+    root.appendChild(header("Checkout: Your Information"));
+    function input(id, test, placeholder) {
+      return h("input", {"class": "input_error form_input", placeholder: placeholder, type: "text",
+                         "data-test": test, id: id, name: test, autocorrect: "off", autocapitalize: "none"});
+    }
+    var first = input("first-name", "firstName", "First Name");
+    var last = input("last-name", "lastName", "Last Name");
+    var zip = input("postal-code", "postalCode", "Zip/Postal Code");
+    var error = h("div", {"class": "error-message-container"});
+    var form = h("form", {}, [
+      h("div", {"class": "checkout_info"}, [
+        h("div", {"class": "form_group"}, [first]),
+        h("div", {"class": "form_group"}, [last]),
+        h("div", {"class": "form_group"}, [zip]),
+        error
+      ]),
+      h("div", {"class": "checkout_buttons"}, [
+        h("button", {id: "cancel", "class": "btn btn_secondary back btn_medium cart_cancel_link", "data-test": "cancel",
+                     type: "button", text: "Cancel", onclick: function () { go("cart.html"); }}),
+        h("input", {type: "submit", id: "continue", "class": "submit-button btn btn_primary cart_button btn_action",
+                    "data-test": "continue", name: "continue", value: "Continue"})
+      ])
+    ]);
+    form.addEventListener("submit", function (e) {
+      e.preventDefault();
+      if (!first.value) return showError(error, "Error: First Name is required");
+      if (!last.value) return showError(error, "Error: Last Name is required");
+      if (!zip.value) return showError(error, "Error: Postal Code is required");
+      go("checkout-step-two.html");
+    });
+    root.appendChild(h("div", {id: "checkout_info_container", "class": "checkout_info_container"}, [form]));
+    renderBadge();
+  };
+
+  pages["checkout-step-two"] = function (root) {
+    root.appendChild(header("Checkout: Overview"));
+    var subtotal = getCart().reduce(function (s, id) { return s + (byId[id] ? byId[id].price : 0); }, 0);
+    var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+    root.appendChild(h("div", {id: "checkout_summary_container"}, [
+      cartRows(false),
+      h("div", {"class": "summary_info"}, [
+        h("div", {"class": "summary_subtotal_label", "data-test": "subtotal-label", text: "Item total: " + money(subtotal)}),
+        h("div", {"class": "summary_tax_label", "data-test": "tax-label", text: "Tax: " + money(tax)}),
+        h("div", {"class": "summary_total_label", "data-test": "total-label", text: "Total: " + money(subtotal + tax)}),
+        h("div", {"class": "cart_footer"}, [
+          h("button", {id: "cancel", "class": "btn btn_secondary back btn_medium cart_cancel_link", "data-test": "cancel",
+                       type: "button", text: "Cancel", onclick: function () { go("inventory.html"); }}),
+          h("button", {id: "finish", "class": "btn btn_action btn_medium cart_button", "data-test": "finish",
+                       type: "button", text: "Finish", onclick: function () { setCart([]); go("checkout-complete.html"); }})
+        ])
+      ])
+    ]));
+    renderBadge();
+  };
+
+  pages["checkout-complete"] = function (root) {
+    root.appendChild(header("Checkout: Complete!"));
+    root.appendChild(h("div", {id: "checkout_complete_container", "class": "checkout_complete_container"}, [
+      h("h2", {"class": "complete-header", "data-test": "complete-header", text: "Thank you for your order!"}),
+      h("div", {"class": "complete-text", "data-test": "complete-text",
+                text: "Your order has been dispatched, and will arrive just as fast as the pony can get there!"}),
+      h("button", {id: "back-to-products", "class": "btn btn_primary btn_small", "data-test": "back-to-products",
+                   type: "button", text: "Back Home", onclick: function () { go("inventory.html"); }})
+    ]));
+  };
+
+  // ---- boot ----
+  var page = document.body.getAttribute("data-page");
+  if (page !== "login" && !getUser()) {
+    window.sessionStorage.setItem("fixture-denied", window.location.pathname);
+    window.location.replace("./");
+    return;
+  }
+  pages[page](document.getElementById("root"));
+})();
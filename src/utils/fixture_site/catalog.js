@@ -0,0 +1,15 @@
+// Default catalog: the six SauceDemo products (same ids as the real `cart-contents` key).
+window.CATALOG = [
+  {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+   desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+  {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+   desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+  {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+   desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+  {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+   desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+  {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+   desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+  {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+   desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."}
+];
@@ -0,0 +1,227 @@
+"""
+Test impact analysis: run only the tests a diff can affect.
+
+Recording (IMPACT_RECORD=true) — while each test runs, sys.setprofile notes every function of
+src/pages and tests/ it calls; the index maps test node ids to "file::Class.method" entries
+and is written to IMPACT_INDEX (default .impact-index.json):
+
+    IMPACT_RECORD=true uv run pytest                       # one process, full suite
+
+CI records it on every push to main and hands it to pull requests through actions/cache
+(.github/workflows/test.yml); the file itself stays out of git.
+
+Selection — changed lines of `git diff <base>` are mapped to functions; tests that called them,
+tests in changed test files and tests missing from the index are selected. Shared infrastructure
+(FULL_RUN_PATHS) or a missing index means a full run:
+
+    uv run python -m src.utils.impact --base origin/main            # print selected node ids
+    uv run python -m src.utils.impact --base origin/main --run -- --alluredir allure-results
+"""
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+INDEX_FILE = ROOT / ".impact-index.json"
+TRACKED_DIRS = ("src/pages/", "tests/")
+# изменения здесь влияют на все тесты сразу
+FULL_RUN_PATHS = ("src/base_test.py", "src/utils/*", "tests/conftest.py", "pyproject.toml", "uv.lock")
+
+
+def impact_record_enabled() -> bool:
+    return os.getenv("IMPACT_RECORD", "false").lower() == "true"
+
+
+def index_path() -> Path:
+    return Path(os.getenv("IMPACT_INDEX", str(INDEX_FILE)))
+
+
+def _relative(filename: str) -> str | None:
+    try:
+        rel = Path(filename).resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return None
+    return rel if rel.startswith(TRACKED_DIRS) and rel.endswith(".py") else None
+
+
+@lru_cache(maxsize=None)
+def function_ranges(rel_path: str) -> tuple[tuple[int, int, str], ...]:
+    """(first line incl. decorators, last line, "Class.method" / "function") of top-level defs."""
+    try:
+        tree = ast.parse((ROOT / rel_path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return ()
+    ranges = []
+
+    def add(node, prefix=""):
+        start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        ranges.append((start, node.end_lineno, prefix + node.name))
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            add(node)
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    add(item, node.name + ".")
+    return tuple(ranges)
+
+
+def qualname_at(rel_path: str, line: int) -> str | None:
+    for start, end, name in function_ranges(rel_path):
+        if start <= line <= end:
+            return name
+    return None
+
+
+class ImpactRecorder:
+    """Collects (file, first line) of called functions per test; resolved to names on save."""
+
+    def __init__(self):
+        self.tests: dict[str, set[str]] = {}
+        self._current: set[tuple[str, int]] | None = None
+        self._seen_files: dict[str, str | None] = {}
+
+    def _profile(self, frame, event, arg):
+        if event != "call":
+            return
+        code = frame.f_code
+        rel = self._seen_files.get(code.co_filename, ...)
+        if rel is ...:
+            rel = self._seen_files[code.co_filename] = _relative(code.co_filename)
+        if rel is not None:
+            self._current.add((rel, code.co_firstlineno))
+
+    def start(self, nodeid: str):
+        self._current = set()
+        self._nodeid = nodeid
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+
+    def stop(self):
+        sys.setprofile(None)
+        threading.setprofile(None)
+        entries = {f"{rel}::{name}" for rel, line in self._current if (name := qualname_at(rel, line))}
+        self.tests[self._nodeid] = entries
+        self._current = None
+
+    def save(self, path: Path | None = None):
+        path = path or index_path()
+        index = load_index(path) or {"tests": {}}
+        index["tests"].update({nodeid: sorted(entries) for nodeid, entries in self.tests.items()})
+        path.write_text(json.dumps(index, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def load_index(path: Path | None = None) -> dict | None:
+    try:
+        return json.loads((path or index_path()).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def changed_lines(base: str) -> dict[str, set[int] | None]:
+    """Changed files of `git diff base` (incl. the working tree) → changed new-side lines; None = deleted."""
+    out = subprocess.run(["git", "diff", "--unified=0", "--no-color", base, "--"],
+                         cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    files: dict[str, set[int] | None] = {}
+    current = None
+    for line in out.splitlines():
+        if line.startswith("--- "):
+            old = line[4:].removeprefix("a/")
+            current = old if old != "/dev/null" else None
+        elif line.startswith("+++ "):
+            new = line[4:].removeprefix("b/")
+            if new == "/dev/null":
+                files[current] = None  # файл удалён
+                current = None
+            else:
+                current = new
+                files.setdefault(current, set())
+        elif current and files.get(current) is not None and (m := _HUNK.match(line)):
+            start, count = int(m.group(3)), int(m.group(4) or 1)
+            # чистое удаление строк: берём строку, рядом с которой оно было
+            files[current].update(range(start, start + count) if count else {max(start, 1)})
+    # новые файлы без коммита git diff не показывает
+    untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"],
+                               cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    for path in untracked.splitlines():
+        files.setdefault(path, {1})
+    return files
+
+
+def needs_full_run(path: str) -> bool:
+    return any(fnmatch.fnmatch(path, pattern) for pattern in FULL_RUN_PATHS)
+
+
+def select(changes: dict[str, set[int] | None], index: dict, collected: list[str]) -> list[str] | None:
+    """Node ids to run, or None for a full run."""
+    if any(needs_full_run(path) for path in changes):
+        return None
+    tests = index["tests"]
+    touched_files: set[str] = set()  # change outside any function: every user of the file
+    touched: set[str] = set()
+    for path, lines in changes.items():
+        if not path.startswith(TRACKED_DIRS) or not path.endswith(".py"):
+            continue
+        if lines is None:
+            touched_files.add(path)
+            continue
+        for line in lines:
+            name = qualname_at(path, line)
+            if name is None:
+                touched_files.add(path)
+                break
+            touched.add(f"{path}::{name}")
+
+    selected = []
+    for nodeid in collected:
+        entries = tests.get(nodeid)
+        test_file = nodeid.split("::", 1)[0]
+        if (entries is None  # новый тест — покрытие неизвестно
+                or test_file in touched_files or test_file in changes
+                or touched.intersection(entries)
+                or any(e.split("::", 1)[0] in touched_files for e in entries)):
+            selected.append(nodeid)
+    return selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base", default="origin/main", help="git revision to diff against")
+    parser.add_argument("--run", action="store_true", help="run pytest with the selection")
+    parser.add_argument("pytest_args", nargs="*", help="extra pytest arguments (after --)")
+    args = parser.parse_args()
+
+    from src.utils.parallel import collect
+    index = load_index()
+    changes = changed_lines(args.base)
+    selected = select(changes, index, collect(["tests"])) if index else None
+
+    if selected is None:
+        reason = "no impact index" if not index else "shared infrastructure changed"
+        print(f"full run: {reason}", file=sys.stderr)
+        targets = ["tests"]
+    else:
+        print(f"{len(selected)} test(s) affected by {len(changes)} changed file(s)", file=sys.stderr)
+        targets = selected
+    if not args.run:
+        print("\n".join(targets))
+        return
+    if not targets:
+        return
+    sys.exit(subprocess.run([sys.executable, "-m", "pytest", *targets, *args.pytest_args], cwd=ROOT).returncode)
+
+
+if __name__ == "__main__":
+    main()
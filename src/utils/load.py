@@ -0,0 +1,202 @@
+"""
+Load / soak mode: N virtual users run the full purchase flow through the regular page objects.
+
+Every virtual user gets its own CDP browser context (Target.createBrowserContext: separate
+cookies and storage, like an incognito window) inside ONE headless Chrome, and its own
+lightweight WebDriver session attached to that Chrome over debuggerAddress. All sessions are
+served by one chromedriver process. Users run on a thread pool.
+
+    uv run python -m src.utils.load --users 8 --iterations 5          # local stand-in site
+    uv run python -m src.utils.load --users 4 --duration 600 --out load.json   # soak
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.pages.cart_page import CartPage
+from src.pages.checkout_page import CheckoutCompletePage, CheckoutStepOnePage, CheckoutStepTwoPage
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.utils.data import VALID_USER
+from src.utils.driver import create_driver
+from src.utils.driver_service import SharedConnections, SharedService
+from src.utils.fixture_server import FixtureServer
+from src.utils.stats import summarize
+
+DEFAULT_ITEMS = ["Sauce Labs Backpack", "Sauce Labs Bike Light"]
+
+
+class VirtualUser:
+    """One browser context of the host Chrome plus a WebDriver session switched to its tab."""
+
+    def __init__(self, host: WebDriver, service: SharedService, connections: SharedConnections):
+        self.host = host
+        self.context_id = host.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+        self.target_id = host.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": self.context_id})["targetId"]
+        opts = webdriver.ChromeOptions()
+        opts.debugger_address = host.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        self.driver = webdriver.Chrome(service=service, options=opts)
+        connections.attach(self.driver)
+        self.driver.set_page_load_timeout(30)
+        self.driver.switch_to.window(self._handle())
+
+    def _handle(self) -> str:
+        # у chromedriver хэндл окна — это id CDP-таргета
+        for handle in self.driver.window_handles:
+            if handle == self.target_id or handle.endswith(self.target_id):
+                return handle
+        raise RuntimeError(f"Target {self.target_id} is not visible to the attached session")
+
+    def close(self):
+        try:
+            self.driver.quit()
+        finally:
+            self.host.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+
+
+@contextmanager
+def _step(timings: dict, name: str):
+    start = time.perf_counter()
+    yield
+    timings[name].append(time.perf_counter() - start)
+
+
+def purchase_flow(driver: WebDriver, items: list[str], timings: dict):
+    """Login → add items → cart → checkout info → overview → complete, each step timed."""
+    with _step(timings, "login"):
+        login = LoginPage(driver)
+        login.open()
+        login.login(VALID_USER["username"], VALID_USER["password"])
+        MainPage(driver).wait_until_loaded()
+    with _step(timings, "add_to_cart"):
+        main = MainPage(driver)
+        main.add_items_to_cart(items)
+    with _step(timings, "open_cart"):
+        main.open_cart()
+        cart = CartPage(driver)
+        cart.wait_until_loaded()
+    with _step(timings, "checkout_info"):
+        cart.proceed_to_checkout()
+        step_1 = CheckoutStepOnePage(driver)
+        step_1.wait_until_loaded()
+        step_1.fill_in_the_form("John", "Doe", "12345")
+        step_1.proceed_to_payment()
+    with _step(timings, "overview"):
+        step_2 = CheckoutStepTwoPage(driver)
+        step_2.wait_until_loaded()
+        step_2.get_subtotal()
+        step_2.finish()
+    with _step(timings, "complete"):
+        if not CheckoutCompletePage(driver).is_loaded():
+            raise AssertionError(f"Order not completed, url={driver.current_url}")
+
+
+class LoadRun:
+    def __init__(self, users: int, iterations: int = 1, duration: float | None = None, items=None):
+        self.users = users
+        self.iterations = iterations
+        self.duration = duration
+        self.items = items or DEFAULT_ITEMS
+        self.timings: dict[str, list[float]] = defaultdict(list)
+        self.flows: list[float] = []
+        self.errors: list[str] = []
+        self._lock = threading.Lock()
+
+    def _user_loop(self, user: VirtualUser, deadline: float | None):
+        done = 0
+        while (deadline is None and done < self.iterations) or (deadline is not None and time.monotonic() < deadline):
+            timings: dict[str, list[float]] = defaultdict(list)
+            start = time.perf_counter()
+            try:
+                purchase_flow(user.driver, self.items, timings)
+                elapsed, error = time.perf_counter() - start, None
+            except Exception as e:
+                elapsed, error = None, f"{type(e).__name__}: {e}".splitlines()[0]
+            with self._lock:
+                for name, values in timings.items():
+                    self.timings[name].extend(values)
+                if error is None:
+                    self.flows.append(elapsed)
+                else:
+                    self.errors.append(error)
+            done += 1
+
+    def run(self) -> dict:
+        host = create_driver()
+        service = SharedService()
+        connections = SharedConnections(self.users)
+        users: list[VirtualUser] = []
+        try:
+            users = [VirtualUser(host, service, connections) for _ in range(self.users)]
+            deadline = time.monotonic() + self.duration if self.duration else None
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.users, thread_name_prefix="vu") as pool:
+                for future in [pool.submit(self._user_loop, user, deadline) for user in users]:
+                    future.result()
+            wall = time.perf_counter() - start
+        finally:
+            for user in users:
+                try:
+                    user.close()
+                except Exception:
+                    pass
+            host.quit()
+            service.shutdown()
+        return self.report(wall)
+
+    def report(self, wall: float) -> dict:
+        return {
+            "users": self.users,
+            "wall_s": wall,
+            "flows": len(self.flows),
+            "errors": len(self.errors),
+            "throughput_flows_per_s": len(self.flows) / wall if wall else 0.0,
+            "flow": summarize(self.flows),
+            "steps": {name: summarize(values) for name, values in self.timings.items()},
+            "error_samples": sorted(set(self.errors))[:10],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=1, help="purchase flows per user")
+    parser.add_argument("--duration", type=float, help="soak: run for this many seconds instead of --iterations")
+    parser.add_argument("--base-url", help="site under test (default: local stand-in site)")
+    parser.add_argument("--out", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("HEADLESS", "true")
+    server = None
+    if args.base_url:
+        os.environ["BASE_URL"] = args.base_url
+    else:
+        server = FixtureServer().start()
+        os.environ["BASE_URL"] = server.url
+    try:
+        report = LoadRun(args.users, args.iterations, args.duration).run()
+    finally:
+        if server is not None:
+            server.stop()
+
+    body = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(body)
+    print(f"{report['flows']} flows, {report['errors']} errors in {report['wall_s']:.1f}s "
+          f"→ {report['throughput_flows_per_s']:.2f} flows/s")
+    print(f"{'step':<14} {'p50, s':>8} {'p95, s':>8} {'max, s':>8}")
+    for name, s in report["steps"].items():
+        print(f"{name:<14} {s['p50']:>8.3f} {s['p95']:>8.3f} {s['max']:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
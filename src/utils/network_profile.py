@@ -0,0 +1,38 @@
+"""
+Network profile of the test browser (NETWORK_PROFILE):
+  full — load everything (default)
+  lean — drop images, fonts and analytics/telemetry through CDP Network.setBlockedURLs;
+         none of the assertions look at them. NETWORK_BLOCK adds comma-separated patterns.
+"""
+import os
+from selenium.webdriver.remote.webdriver import WebDriver
+
+BLOCKED_URLS = [
+    # images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    # fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    # analytics / telemetry
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*backtrace.io*", "*facebook.net*", "*hotjar.com*", "*segment.io*",
+]
+
+
+def network_profile() -> str:
+    return os.getenv("NETWORK_PROFILE", "full").lower()
+
+
+def blocked_urls() -> list[str]:
+    extra = [p.strip() for p in os.getenv("NETWORK_BLOCK", "").split(",") if p.strip()]
+    return BLOCKED_URLS + extra
+
+
+def apply_network_profile(driver: WebDriver, profile: str | None = None):
+    profile = profile or network_profile()
+    if profile == "full":
+        return
+    if profile != "lean":
+        raise ValueError(f"Unknown NETWORK_PROFILE: {profile!r} (expected 'full' or 'lean')")
+    # правила живут в сессии, поэтому тёплые браузеры из пула их сохраняют
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls()})
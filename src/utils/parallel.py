@@ -0,0 +1,122 @@
+"""
+Parallel runner: K pytest workers, one Chrome profile/driver per worker,
+tests balanced by recorded durations (longest first) instead of file order.
+
+    uv run python -m src.utils.parallel -n 8 --alluredir allure-results
+    uv run python -m src.utils.parallel -n 4 tests/test_3.py tests/test_4.py -- -x
+
+Durations are re-recorded on every run into .test_durations.json.
+"""
+import argparse
+import heapq
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DURATIONS_FILE = ROOT / ".test_durations.json"
+DEFAULT_DURATION = 10.0  # seconds, for tests that were never recorded
+
+
+def collect(targets: list[str]) -> list[str]:
+    out = subprocess.run(
+        # addopts уже содержит -q, а -qq печатает только счётчики по файлам
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", "-p", "no:cacheprovider", *targets],
+        cwd=ROOT, capture_output=True, text=True, check=False,
+    ).stdout
+    return [line.strip() for line in out.splitlines() if "::" in line]
+
+
+def load_durations(path: Path = DURATIONS_FILE) -> dict[str, float]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def shard(test_ids: list[str], durations: dict[str, float], workers: int) -> list[list[str]]:
+    """Longest-processing-time-first: next longest test goes to the least loaded worker."""
+    known = [durations[t] for t in test_ids if t in durations]
+    default = statistics.median(known) if known else DEFAULT_DURATION
+    ordered = sorted(test_ids, key=lambda t: durations.get(t, default), reverse=True)
+
+    shards: list[list[str]] = [[] for _ in range(workers)]
+    heap = [(0.0, i) for i in range(workers)]
+    for test_id in ordered:
+        load, i = heapq.heappop(heap)
+        shards[i].append(test_id)
+        heapq.heappush(heap, (load + durations.get(test_id, default), i))
+    return [s for s in shards if s]
+
+
+def merge_allure(worker_dirs: list[Path], target: Path):
+    # имена файлов allure — uuid, поэтому достаточно сложить всё в одну папку
+    target.mkdir(parents=True, exist_ok=True)
+    for d in worker_dirs:
+        if d.is_dir():
+            for f in d.iterdir():
+                shutil.copy2(f, target / f.name)
+
+
+def run(targets: list[str], workers: int, alluredir: Path | None, extra: list[str]) -> int:
+    test_ids = collect(targets)
+    if not test_ids:
+        print("No tests collected")
+        return 5
+
+    durations = load_durations()
+    shards = shard(test_ids, durations, workers)
+    tmp = Path(tempfile.mkdtemp(prefix="parallel-"))
+    procs = []
+    start = time.perf_counter()
+    for i, ids in enumerate(shards):
+        args_file = tmp / f"worker-{i}.args"
+        args_file.write_text("\n".join(ids), encoding="utf-8")
+        cmd = [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", f"@{args_file}", *extra]
+        if alluredir:
+            cmd.append(f"--alluredir={tmp / f'allure-{i}'}")
+        env = dict(
+            os.environ,
+            WORKER_ID=str(i),
+            CHROME_PROFILE_DIR=str(tmp / f"profile-{i}"),
+            DURATIONS_FILE=str(tmp / f"durations-{i}.json"),
+        )
+        procs.append(subprocess.Popen(cmd, cwd=ROOT, env=env))
+
+    codes = [p.wait() for p in procs]
+    wall = time.perf_counter() - start
+
+    for i in range(len(shards)):
+        durations.update(load_durations(tmp / f"durations-{i}.json"))
+    DURATIONS_FILE.write_text(json.dumps(durations, indent=2, sort_keys=True), encoding="utf-8")
+
+    if alluredir:
+        merge_allure([tmp / f"allure-{i}" for i in range(len(shards))], alluredir)
+    shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"\n{len(test_ids)} tests on {len(shards)} workers, wall time {wall:.1f}s")
+    failed = [c for c in codes if c not in (0, 5)]
+    return failed[0] if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", default=["tests"])
+    parser.add_argument("-n", "--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--alluredir", type=Path)
+    argv, extra = sys.argv[1:], []
+    if "--" in argv:  # всё после "--" уходит воркерам как есть
+        i = argv.index("--")
+        argv, extra = argv[:i], argv[i + 1:]
+    args = parser.parse_args(argv)
+    sys.exit(run(args.targets, args.workers, args.alluredir, extra))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Front-end performance of the pages under test (PAGE_PERF):
+  off     — nothing is measured (default)
+  report  — @page_perf methods (wait_until_loaded and navigation methods) read Navigation Timing,
+            first-contentful-paint, long tasks and transferred bytes through the Performance API
+            in one script call and attach them to their Allure step
+  enforce — same, and the test fails when a metric is over its threshold
+
+Thresholds: DEFAULT_THRESHOLDS, overridden by the JSON file in PERF_THRESHOLDS with keys
+"*", "Page" or "Page.method", e.g. {"MainPage": {"fcp_ms": 1500}, "*": {"long_tasks_ms": 200}}.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+import allure
+
+from src.utils.stats import summarize
+
+DEFAULT_THRESHOLDS = {
+    "*": {"ttfb_ms": 1500, "fcp_ms": 2500, "load_ms": 4000, "long_tasks_ms": 300, "elapsed_ms": 5000},
+}
+
+# Navigation Timing is per document: on soft (SPA) navigations only the delta since the previous
+# measurement is reported — long tasks, resources and bytes — plus the Python-side elapsed time.
+_PERF_JS = """
+    var done = arguments[arguments.length - 1];
+    var p = window.__pagePerf;
+    if (!p) {
+        p = window.__pagePerf = {longTasks: [], mark: 0};
+        try {
+            new PerformanceObserver(function (list) {
+                list.getEntries().forEach(function (e) { p.longTasks.push([e.startTime, e.duration]); });
+            }).observe({type: 'longtask', buffered: true});
+        } catch (e) { p.noLongTasks = true; }
+    }
+    // buffered long tasks are delivered asynchronously — give the observer one turn
+    setTimeout(function () {
+        var since = p.mark, soft = since > 0;
+        var nav = performance.getEntriesByType('navigation')[0] || {};
+        var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+        var resources = performance.getEntriesByType('resource').filter(function (r) { return r.startTime >= since; });
+        var bytes = resources.reduce(function (s, r) { return s + (r.transferSize || 0); }, soft ? 0 : (nav.transferSize || 0));
+        var tasks = p.longTasks.filter(function (t) { return t[0] >= since; });
+        p.mark = performance.now();
+        done({
+            url: window.location.href,
+            soft_navigation: soft,
+            ttfb_ms: soft || !nav.responseStart ? null : nav.responseStart - nav.startTime,
+            dom_content_loaded_ms: soft || !nav.domContentLoadedEventEnd ? null : nav.domContentLoadedEventEnd,
+            load_ms: soft || !nav.loadEventEnd ? null : nav.loadEventEnd,
+            fcp_ms: soft || !fcp ? null : fcp.startTime,
+            long_tasks: p.noLongTasks ? null : tasks.length,
+            long_tasks_ms: p.noLongTasks ? null : tasks.reduce(function (s, t) { return s + t[1]; }, 0),
+            resources: resources.length,
+            transferred_bytes: bytes
+        });
+    }, 0);
+"""
+
+
+def page_perf_mode() -> str:
+    mode = os.getenv("PAGE_PERF", "off").lower()
+    if mode not in ("off", "report", "enforce"):
+        raise ValueError(f"Unknown PAGE_PERF: {mode!r} (expected 'off', 'report' or 'enforce')")
+    return mode
+
+
+@functools.lru_cache(maxsize=None)
+def _load_thresholds(path: str | None) -> dict:
+    thresholds = {key: dict(limits) for key, limits in DEFAULT_THRESHOLDS.items()}
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for key, limits in json.load(f).items():
+                thresholds.setdefault(key, {}).update(limits)
+    return thresholds
+
+
+def thresholds_for(page: str, method: str) -> dict:
+    thresholds = _load_thresholds(os.getenv("PERF_THRESHOLDS"))
+    limits: dict = {}
+    for key in ("*", page, f"{page}.{method}"):
+        limits.update(thresholds.get(key, {}))
+    return limits
+
+
+@dataclass
+class PerfRecord:
+    page: str
+    method: str
+    elapsed_ms: float
+    metrics: dict
+    violations: list[str] = field(default_factory=list)
+
+
+class PerfStats:
+    def __init__(self):
+        self.records: list[PerfRecord] = []
+        self._lock = threading.Lock()
+
+    def record(self, rec: PerfRecord):
+        with self._lock:
+            self.records.append(rec)
+
+    def mark(self) -> int:
+        return len(self.records)
+
+    def since(self, mark: int) -> list[PerfRecord]:
+        return self.records[mark:]
+
+    def test_report(self, mark: int) -> dict:
+        records = self.since(mark)
+        by_step: dict[str, list[float]] = {}
+        for rec in records:
+            by_step.setdefault(f"{rec.page}.{rec.method}", []).append(rec.elapsed_ms)
+        return {
+            "records": [asdict(r) for r in records],
+            "elapsed_ms": {key: summarize(values) for key, values in by_step.items()},
+            "violations": [v for r in records for v in r.violations],
+        }
+
+
+stats = PerfStats()
+
+
+def collect(driver) -> dict:
+    return driver.execute_async_script(_PERF_JS)
+
+
+def _check(page: str, method: str, values: dict) -> list[str]:
+    violations = []
+    for metric, limit in thresholds_for(page, method).items():
+        value = values.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{page}.{method}: {metric}={value:.0f} > {limit}")
+    return violations
+
+
+def page_perf(method):
+    """
+    Page-object method decorator: with PAGE_PERF on, time the call and read the page's
+    Performance API metrics right after it. Put it under @allure.step so the metrics are
+    attached to that step.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        mode = page_perf_mode()
+        if mode == "off":
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        page = type(self).__name__
+        try:
+            metrics = collect(self.driver)
+        except Exception as e:
+            # метрики — побочный продукт, шаг из-за них не роняем
+            metrics = {"error": f"{type(e).__name__}: {e}".splitlines()[0]}
+        rec = PerfRecord(page, method.__name__, elapsed_ms, metrics,
+                         _check(page, method.__name__, {**metrics, "elapsed_ms": elapsed_ms}))
+        stats.record(rec)
+        allure.attach(json.dumps(asdict(rec), indent=2), "Page performance", allure.attachment_type.JSON)
+        return result
+
+    return wrapper
@@ -0,0 +1,99 @@
+"""
+WebDriver command profiler.
+
+Wraps the driver's command executor and counts/times every HTTP command to chromedriver
+by command name and by the calling page-object method. Enabled for every test with
+PROFILE_COMMANDS=true, or for a single test by @command_budget(n), which also fails the
+test when it issues more than n commands.
+"""
+import functools
+import os
+import time
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.callsite import page_call_site
+
+
+def profiler_enabled() -> bool:
+    return os.getenv("PROFILE_COMMANDS", "false").lower() == "true"
+
+
+class CommandProfiler:
+    def __init__(self, driver: WebDriver):
+        self.executor = driver.command_executor
+        self.records: list[tuple[str, str, float]] = []  # (command, Page.method, seconds)
+        self._original = None
+
+    def start(self) -> "CommandProfiler":
+        original = self._original = self.executor.execute
+
+        def profiled(command, params):
+            start = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                site = page_call_site(skip=2)
+                self.records.append((command, ".".join(site) if site else "(test)", time.perf_counter() - start))
+
+        self.executor.execute = profiled
+        return self
+
+    def stop(self):
+        if self._original is not None:
+            # снимаем обёртку: сессия может вернуться в пул
+            self.executor.execute = self._original
+            self._original = None
+
+    def __enter__(self) -> "CommandProfiler":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def total(self) -> int:
+        return len(self.records)
+
+    def summary(self) -> dict:
+        by_command: dict[str, dict] = {}
+        by_method: dict[str, dict] = {}
+        for command, site, elapsed in self.records:
+            for key, bucket in ((command, by_command), (site, by_method)):
+                entry = bucket.setdefault(key, {"count": 0, "time_s": 0.0})
+                entry["count"] += 1
+                entry["time_s"] += elapsed
+
+        def ordered(bucket):
+            return dict(sorted(bucket.items(), key=lambda kv: kv[1]["count"], reverse=True))
+
+        return {
+            "commands": self.total,
+            "time_s": sum(r[2] for r in self.records),
+            "by_command": ordered(by_command),
+            "by_method": ordered(by_method),
+        }
+
+
+def command_budget(max_commands: int):
+    """
+    Test decorator: the test fails if it sends more than `max_commands` WebDriver commands
+    (session start in setUp is not counted).
+
+        @command_budget(120)
+        def test_successful_checkout(self): ...
+    """
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(self, *args, **kwargs):
+            result = test(self, *args, **kwargs)
+            used = self.profiler.total
+            if used > max_commands:
+                top = list(self.profiler.summary()["by_method"].items())[:5]
+                details = ", ".join(f"{site}={entry['count']}" for site, entry in top)
+                raise AssertionError(f"WebDriver command budget exceeded: {used} > {max_commands} ({details})")
+            return result
+
+        wrapper.command_budget = max_commands
+        return wrapper
+
+    return decorator
@@ -0,0 +1,169 @@
+"""
+Allure step reporting mode (ALLURE_STEPS):
+  full     — every step goes to Allure as it happens (default, same as @allure.step)
+  buffered — steps are recorded in memory (title template, args, timing, error) and written to
+             Allure once in tearDown; titles are formatted only then. Lazy steps that need the
+             driver (e.g. the current URL) become one "<label> at failure" step, only when the test failed.
+  off      — no steps at all
+
+`step` is a drop-in for `allure.step` — decorator or context manager:
+
+    @step("Remove item from cart by name: {name}")
+    def remove_item_by_name(self, name): ...
+"""
+import functools
+import os
+import threading
+import time
+import allure
+from allure_commons.utils import func_parameters, represent
+
+
+def allure_steps_mode() -> str:
+    mode = os.getenv("ALLURE_STEPS", "full").lower()
+    if mode not in ("full", "buffered", "off"):
+        raise ValueError(f"Unknown ALLURE_STEPS: {mode!r} (expected 'full', 'buffered' or 'off')")
+    return mode
+
+
+class _Record:
+    __slots__ = ("title", "children", "start", "stop", "error", "lazy")
+
+    def __init__(self, title, lazy: bool = False):
+        self.title = title  # str or callable -> str, rendered at flush
+        self.children: list[_Record] = []
+        self.start = time.perf_counter()
+        self.stop: float | None = None
+        self.error: BaseException | None = None
+        self.lazy = lazy
+
+
+class StepBuffer:
+    """Steps of the current test; only the thread that called begin() records."""
+
+    def __init__(self):
+        self._roots: list[_Record] = []
+        self._stack: list[_Record] = []
+        self._owner: int | None = None
+
+    def begin(self):
+        self._roots, self._stack = [], []
+        self._owner = threading.get_ident()
+
+    def recording(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def open(self, title, lazy: bool = False) -> _Record:
+        rec = _Record(title, lazy)
+        (self._stack[-1].children if self._stack else self._roots).append(rec)
+        self._stack.append(rec)
+        return rec
+
+    def close(self, rec: _Record, error: BaseException | None = None):
+        rec.stop = time.perf_counter()
+        rec.error = error
+        if self._stack and self._stack[-1] is rec:
+            self._stack.pop()
+
+    def flush(self, failed: bool):
+        """Write the recorded steps to Allure (nested, with their duration and failures)."""
+        roots, self._roots, self._stack, self._owner = self._roots, [], [], None
+        lazy: dict[str, object] = {}  # label -> getter, в порядке первого появления
+        self._replay(roots, lazy)
+        if not failed:
+            return  # успешный тест — драйвер не трогаем
+        # значение известно только на момент падения: одна запись на label, а не N одинаковых
+        for label, getter in lazy.items():
+            try:
+                value = getter()
+            except Exception as e:
+                value = f"<{type(e).__name__}>"
+            with allure.step(f"{label} at failure: {value}"):
+                pass
+
+    def _replay(self, records: list[_Record], lazy: dict):
+        for rec in records:
+            if rec.lazy:
+                label, getter = rec.title
+                lazy.setdefault(label, getter)
+                continue
+            title = rec.title() if callable(rec.title) else rec.title
+            if rec.stop is not None:
+                title += f" [{(rec.stop - rec.start) * 1000:.0f} ms]"
+            try:
+                with allure.step(title):
+                    self._replay(rec.children, lazy)
+                    if rec.error is not None:
+                        raise rec.error  # тот же статус шага, что и в режиме full
+            except Exception as e:
+                if e is not rec.error:
+                    raise
+
+
+steps = StepBuffer()
+
+
+class step:
+    def __init__(self, title: str):
+        self.title = title
+        self._records: list[_Record] = []
+
+    def __enter__(self):
+        mode = allure_steps_mode()
+        if mode == "buffered" and steps.recording():
+            self._records.append(steps.open(self.title))
+        elif mode != "off":
+            context = allure.step(self.title)
+            context.__enter__()
+            self._records.append(context)
+        else:
+            self._records.append(None)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        entry = self._records.pop()
+        if isinstance(entry, _Record):
+            steps.close(entry, exc_val)
+        elif entry is not None:
+            entry.__exit__(exc_type, exc_val, exc_tb)
+
+    def __call__(self, func):
+        full = allure.step(self.title)(func)
+        title = self.title
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mode = allure_steps_mode()
+            if mode == "full" or (mode == "buffered" and not steps.recording()):
+                return full(*args, **kwargs)
+            if mode == "off":
+                return func(*args, **kwargs)
+
+            def render():
+                # как в allure.step, но только при записи отчёта
+                params = func_parameters(func, *args, **kwargs)
+                return title.format(*[represent(a) for a in args], **params)
+
+            rec = steps.open(render)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                steps.close(rec, e)
+                raise
+            steps.close(rec)
+            return result
+
+        return wrapper
+
+
+def lazy_step(label: str, getter):
+    """
+    A step whose title needs the driver, e.g. lazy_step("URL", lambda: driver.current_url).
+    full: evaluated now; buffered: one "<label> at failure" step per label, evaluated in tearDown
+    and only if the test failed; off: skipped.
+    """
+    mode = allure_steps_mode()
+    if mode == "full" or (mode == "buffered" and not steps.recording()):
+        with allure.step(f"{label}: {getter()}"):
+            pass
+    elif mode == "buffered":
+        steps.close(steps.open((label, getter), lazy=True))
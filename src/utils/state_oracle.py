@@ -0,0 +1,106 @@
+"""
+Application state straight from the browser storage instead of the rendered DOM.
+
+SauceDemo keeps the cart as a JSON list of product ids in the `cart-contents` localStorage key
+and the user in the `session-username` cookie. StateOracle reads both (plus the URL) in one
+execute_script and resolves ids through the product catalog:
+
+    state = StateOracle(driver).read()
+    assert state.names == {"Sauce Labs Backpack"} and state.user == "standard_user"
+
+Use it to check business state; keep DOM reads (badge, cart rows) for tests of the rendering.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.data import PRODUCTS
+from src.utils.reporting import step
+
+_STATE_JS = """
+    var m = document.cookie.match(/(?:^|;\\s*)session-username=([^;]*)/);
+    var raw = null, cart = null;
+    try { raw = window.localStorage.getItem('cart-contents'); } catch (e) {}
+    try { cart = JSON.parse(raw || '[]'); } catch (e) {}
+    return {url: window.location.href, user: m ? decodeURIComponent(m[1]) : null, cart: cart};
+"""
+
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    name: str
+    price: float
+
+
+@dataclass(frozen=True)
+class AppState:
+    url: str
+    user: str | None  # None — не залогинен
+    cart: tuple[Product, ...]  # in storage order
+    unknown_ids: tuple[int, ...] = ()  # ids missing from the catalog
+    corrupt: bool = False  # `cart-contents` is not a JSON list
+
+    @property
+    def ids(self) -> list[int]:
+        return [p.id for p in self.cart]
+
+    @property
+    def names(self) -> set[str]:
+        return {p.name for p in self.cart}
+
+    @property
+    def count(self) -> int:
+        return len(self.cart) + len(self.unknown_ids)
+
+    @property
+    def subtotal(self) -> float:
+        return round(sum(p.price for p in self.cart), 2)
+
+
+@lru_cache(maxsize=None)
+def _by_id(products: tuple[tuple[str, int, float], ...]) -> dict[int, Product]:
+    return {pid: Product(pid, name, price) for name, pid, price in products}
+
+
+def _catalog_key(products: dict) -> tuple[tuple[str, int, float], ...]:
+    return tuple((name, p["id"], p["price"]) for name, p in products.items())
+
+
+class StateOracle:
+    def __init__(self, driver: WebDriver, products: dict = PRODUCTS):
+        """`products`: name -> {"id", "price"}, as PRODUCTS (the id index is built once per catalog)."""
+        self.driver = driver
+        self.catalog = _by_id(_catalog_key(products))
+
+    def parse(self, raw: dict | None) -> AppState:
+        """AppState from the `_STATE_JS` result (None — page without storage access, e.g. about:blank)."""
+        raw = raw or {"url": "", "user": None, "cart": []}
+        ids = raw["cart"]
+        corrupt = not isinstance(ids, list)
+        known, unknown = [], []
+        for pid in ([] if corrupt else ids):
+            product = self.catalog.get(pid) if isinstance(pid, int) else None
+            if product is None:
+                unknown.append(pid)
+            else:
+                known.append(product)
+        return AppState(raw["url"], raw["user"] or None, tuple(known), tuple(unknown), corrupt)
+
+    @step("Read app state from storage")
+    def read(self) -> AppState:
+        try:
+            raw = self.driver.execute_script(_STATE_JS)
+        except WebDriverException:
+            raw = None  # about:blank / data: — нет доступа к storage
+        return self.parse(raw)
+
+    def cart_count(self) -> int:
+        return self.read().count
+
+    def cart_names(self) -> set[str]:
+        return self.read().names
+
+    def user(self) -> str | None:
+        return self.read().user
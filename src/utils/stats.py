@@ -0,0 +1,51 @@
+import math
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile, q in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values: list[float]) -> dict:
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values) if values else 0.0,
+        "total": sum(values),
+    }
+
+
+def mann_whitney_greater(baseline: list[float], current: list[float]) -> float:
+    """
+    One-sided Mann–Whitney U test: p-value of "current is stochastically greater than baseline"
+    (normal approximation with tie and continuity correction). Small p — a real slowdown.
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted([(v, 0) for v in baseline] + [(v, 1) for v in current])
+    ranks = [0.0] * len(combined)
+    ties = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1  # средний ранг для одинаковых значений
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    n = n1 + n2
+    u_baseline = sum(r for r, (_, group) in zip(ranks, combined) if group == 0) - n1 * (n1 + 1) / 2
+    mu = n1 * n2 / 2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1))))
+    if sigma == 0:
+        return 1.0
+    z = (u_baseline - mu + 0.5) / sigma
+    return 0.5 * math.erfc(-z / math.sqrt(2))
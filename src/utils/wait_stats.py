@@ -0,0 +1,78 @@
+"""
+Wait instrumentation (WAIT_STATS=true): every Wait.until is recorded with its page
+class, method, condition, time to satisfy, poll count and timeout hit/miss.
+Per-test records are attached to Allure by UiTestCase; the per-run histogram
+(p50/p95/max per condition) is written as JSON at the end of the session.
+"""
+import os
+import threading
+from dataclasses import asdict, dataclass
+
+from src.utils.stats import summarize
+
+
+def wait_stats_enabled() -> bool:
+    return os.getenv("WAIT_STATS", "false").lower() == "true"
+
+
+@dataclass
+class WaitRecord:
+    page: str
+    method: str
+    condition: str
+    elapsed: float
+    polls: int
+    timeout: float
+    timed_out: bool
+
+    @property
+    def key(self) -> str:
+        return f"{self.page}.{self.method} | {self.condition}"
+
+
+class WaitStats:
+    def __init__(self):
+        self.records: list[WaitRecord] = []
+        self._lock = threading.Lock()
+
+    def record(self, rec: WaitRecord):
+        with self._lock:
+            self.records.append(rec)
+
+    def mark(self) -> int:
+        return len(self.records)
+
+    def since(self, mark: int) -> list[WaitRecord]:
+        return self.records[mark:]
+
+    def histogram(self, records: list[WaitRecord] | None = None) -> dict:
+        records = self.records if records is None else records
+        groups: dict[str, list[WaitRecord]] = {}
+        for rec in records:
+            groups.setdefault(rec.key, []).append(rec)
+
+        by_condition = {}
+        for key, recs in groups.items():
+            summary = summarize([r.elapsed for r in recs])
+            timeout = max(r.timeout for r in recs)
+            by_condition[key] = {
+                **summary,
+                "timeouts": sum(r.timed_out for r in recs),
+                "timeout_s": timeout,
+                # max / timeout: близко к 0 — таймаут явно с большим запасом
+                "max_share_of_timeout": summary["max"] / timeout if timeout else 0.0,
+                "polls": sum(r.polls for r in recs),
+            }
+        ordered = dict(sorted(by_condition.items(), key=lambda kv: kv[1]["total"], reverse=True))
+        return {
+            "waits": len(records),
+            "total_s": sum(r.elapsed for r in records),
+            "by_condition": ordered,
+        }
+
+    def test_report(self, mark: int) -> dict:
+        records = self.since(mark)
+        return {"records": [asdict(r) for r in records], **self.histogram(records)}
+
+
+stats = WaitStats()
@@ -0,0 +1,131 @@
+"""
+Event-driven waits.
+
+Wait(driver, timeout).until(condition) is a drop-in for WebDriverWait: a Condition from
+src.utils.conditions is sent to the page once as execute_async_script and resolved there
+by MutationObserver / requestAnimationFrame, so it returns as soon as the condition holds
+instead of on the next 0.5 s poll. Plain callables (lambdas, expected_conditions) and
+EVENT_WAITS=false fall back to classic WebDriverWait polling.
+"""
+import os
+import time
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.utils.callsite import page_call_site
+from src.utils.conditions import Condition
+from src.utils.wait_stats import WaitRecord, stats, wait_stats_enabled
+
+
+# JavascriptException от выгрузки документа (навигация во время ожидания) — ждём заново на новой странице
+_DOCUMENT_CHANGED = ("document unloaded", "navigated", "context was destroyed", "cannot find context")
+
+
+def event_waits_enabled() -> bool:
+    return os.getenv("EVENT_WAITS", "true").lower() == "true"
+
+
+_WAIT_JS = """
+var timeout = arguments[0], done = arguments[arguments.length - 1];
+var lastError = null;
+function check() { try { return (__CONDITION__); } catch (e) { lastError = String(e); return null; } }
+var first = check();
+if (first) { done(first); return; }
+var finished = false, observer = null, timer = null, interval = null;
+function finish(v) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(interval);
+    done(v);
+}
+function tick() { if (!finished) { var r = check(); if (r) finish(r); } }
+observer = new MutationObserver(tick);
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+// URL, style and layout changes do not always mutate the DOM — re-check every frame,
+// plus a slow interval for throttled background tabs where rAF does not fire
+(function frame() { if (!finished) { tick(); window.requestAnimationFrame(frame); } })();
+interval = setInterval(tick, 100);
+// таймаут: отдаём последнюю ошибку условия (например, невалидный селектор) в сообщение
+timer = setTimeout(function () { finish({__waitTimeout: true, error: lastError}); }, timeout);
+"""
+
+
+class Wait:
+    def __init__(self, driver: WebDriver, timeout: float, poll_frequency: float = 0.5, ignored_exceptions=None):
+        self._driver = driver
+        self._timeout = timeout
+        self._poll = poll_frequency
+        self._ignored = ignored_exceptions
+        self._polls = 0
+
+    def until(self, condition, message: str = ""):
+        if not wait_stats_enabled():
+            return self._until(condition, message)
+
+        self._polls = 0
+        timed_out = False
+        start = time.perf_counter()
+        try:
+            return self._until(condition, message)
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            page, method = page_call_site(skip=2) or ("-", "-")
+            stats.record(WaitRecord(
+                page=page,
+                method=method,
+                condition=_describe(condition),
+                elapsed=time.perf_counter() - start,
+                polls=self._polls,
+                timeout=self._timeout,
+                timed_out=timed_out,
+            ))
+
+    def _until(self, condition, message: str):
+        if isinstance(condition, Condition) and event_waits_enabled():
+            return self._until_in_browser(condition, message)
+
+        def polled(driver):
+            self._polls += 1
+            return condition(driver)
+
+        return WebDriverWait(self._driver, self._timeout, self._poll, self._ignored).until(polled, message)
+
+    def _until_in_browser(self, condition: Condition, message: str):
+        script = _WAIT_JS.replace("__CONDITION__", condition.js)
+        deadline = time.monotonic() + self._timeout
+        last_error = None
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or last_error is not None:
+                detail = f" (last condition error: {last_error})" if last_error else ""
+                raise TimeoutException(
+                    (message or f"Timed out after {self._timeout}s waiting for {condition!r}") + detail)
+            self._polls += 1
+            try:
+                result = self._driver.execute_async_script(script, int(remaining * 1000))
+            except JavascriptException as e:
+                if not any(marker in (e.msg or "").lower() for marker in _DOCUMENT_CHANGED):
+                    raise  # ошибка самого скрипта — повтор даст то же самое
+                continue
+            except TimeoutException:
+                continue  # script timeout драйвера короче ожидания: скрипт честно ждал, пробуем ещё раз
+            if isinstance(result, dict) and result.get("__waitTimeout"):
+                # страница прождала весь остаток таймаута сама — повторять нечего
+                last_error = result.get("error") or ""
+                continue
+            if result:
+                return condition.result(result)
+
+
+def _describe(condition) -> str:
+    if isinstance(condition, Condition):
+        return condition.description
+    code = getattr(condition, "__code__", None)
+    if code is not None:  # lambda / local function: name + where it is defined
+        return f"{code.co_name}@{os.path.basename(code.co_filename)}:{code.co_firstlineno}"
+    return type(condition).__name__
@@ -1,3 +1,91 @@
-import sys, pathlib
+import json, os, sys, pathlib
 ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
\ No newline at end of file
+sys.path.insert(0, str(ROOT))
+
+from src.utils.fixture_server import FixtureServer, local_site_enabled
+from src.utils.impact import ImpactRecorder, impact_record_enabled
+from src.utils.driver_factory import startup_stats_enabled, startup_times
+from src.utils.driver_service import service_metrics, shared_service_enabled
+from src.utils.stats import summarize
+from src.utils.wait_stats import stats as wait_stats, wait_stats_enabled
+import allure
+import pytest
+
+_durations: dict[str, float] = {}
+_impact = ImpactRecorder() if impact_record_enabled() else None
+
+
+def pytest_sessionstart(session):
+    # LOCAL_SITE=true: one offline stand-in per pytest session (per worker)
+    if local_site_enabled():
+        server = FixtureServer().start()
+        os.environ["BASE_URL"] = server.url
+        session.config._fixture_server = server
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # IMPACT_RECORD=true: page-object methods called by the test (setUp/tearDown included)
+    if _impact is None:
+        yield
+        return
+    _impact.start(item.nodeid)
+    try:
+        yield
+    finally:
+        _impact.stop()
+
+
+def pytest_runtest_logreport(report):
+    # DURATIONS_FILE is set by src.utils.parallel to balance the next run
+    if os.getenv("DURATIONS_FILE"):
+        _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session):
+    server = getattr(session.config, "_fixture_server", None)
+    if server:
+        server.stop()
+    if _impact is not None and _impact.tests:
+        _impact.save()
+    if os.getenv("DURATIONS_FILE") and _durations:
+        pathlib.Path(os.environ["DURATIONS_FILE"]).write_text(json.dumps(_durations), encoding="utf-8")
+    if wait_stats_enabled():
+        _write_wait_stats()
+    if startup_stats_enabled() and startup_times:
+        _write_startup_stats()
+    if shared_service_enabled():
+        _write_service_metrics()
+
+
+def _write_wait_stats():
+    # per-run histogram: p50/p95/max per "Page.method | condition"
+    worker = os.getenv("WORKER_ID")
+    default = f"wait-stats-{worker}.json" if worker else "wait-stats.json"
+    body = json.dumps(wait_stats.histogram(), indent=2)
+    pathlib.Path(os.getenv("WAIT_STATS_FILE", default)).write_text(body, encoding="utf-8")
+    if hasattr(allure, "global_attach"):  # allure-pytest >= 2.15
+        allure.global_attach(body, name="Wait stats (run)", attachment_type=allure.attachment_type.JSON)
+
+
+def _write_startup_stats():
+    # driver acquire time per test: ~0 when DRIVER_PREWARM/DRIVER_POOL take startup off the critical path
+    worker = os.getenv("WORKER_ID")
+    path = f"startup-stats-{worker}.json" if worker else "startup-stats.json"
+    body = json.dumps({
+        "prewarm": os.getenv("DRIVER_PREWARM", "0"),
+        "pool": os.getenv("DRIVER_POOL", "false"),
+        "driver_acquire_s": summarize(startup_times),
+        "per_test_s": startup_times,
+    }, indent=2)
+    pathlib.Path(path).write_text(body, encoding="utf-8")
+
+
+def _write_service_metrics():
+    # chromedriver processes started and keep-alive connection reuse of this worker
+    worker = os.getenv("WORKER_ID")
+    path = f"service-metrics-{worker}.json" if worker else "service-metrics.json"
+    body = json.dumps(service_metrics(), indent=2)
+    pathlib.Path(path).write_text(body, encoding="utf-8")
+    if hasattr(allure, "global_attach"):
+        allure.global_attach(body, name="Driver service metrics", attachment_type=allure.attachment_type.JSON)
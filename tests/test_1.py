@@ -11,7 +11,8 @@ class TestLogin(UiTestCase):
     def test_valid_login(self):
          page = LoginPage(self.driver)
          page.open()
-         page.login("standard_user", "secret_sauce")
+         # единственный тест с посимвольным вводом — как у реального пользователя
+         page.login("standard_user", "secret_sauce", typing=True)
          page.wait_success()
     @allure.story("Invalid Password")
     def test_invalid_password(self):
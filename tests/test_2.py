@@ -1,16 +1,17 @@
 from src.base_test import UiTestCase
 from src.pages.login_page import LoginPage
 from src.pages.main_page import MainPage
+from src.utils.config import url
+from src.utils.data import VALID_USER
+from src.utils.state_oracle import StateOracle
 import allure
 import  random
 
 def login_as_standard_user(driver):
-    login = LoginPage(driver)
-    login.open()
-    login.login("standard_user", "secret_sauce")
+    # setup only: the login form itself is covered in test_1.py
+    LoginPage(driver).inject_session(VALID_USER)
+    MainPage(driver).wait_until_loaded()
 
-cart_address = "https://www.saucedemo.com/cart.html"
-login_address = "https://www.saucedemo.com/"
 
 @allure.epic("Website")
 @allure.feature("Inventory")
@@ -28,11 +29,12 @@ class TestMain(UiTestCase):
         main_page = MainPage(self.driver)
         main_page.wait_until_loaded()
         items = ["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Bolt T-Shirt"]
-        main_page.add_item_to_cart(random.choice(items))
-        self.assertEqual(
-            1, main_page.get_cart_count(), f"There should be 1 item, "
-                                        f"but actually there are {main_page.get_cart_count()}"
-        )
+        item = random.choice(items)
+        main_page.add_item_to_cart(item)
+        state = StateOracle(self.driver).read()
+        self.assertEqual({item}, state.names, f"Cart in storage: {state.ids}")
+        # бейдж — это рендеринг, его проверяем отдельно
+        self.assertEqual(1, main_page.get_cart_count())
 
     @allure.story("Adding several items to cart")
     def test_add_several_items(self):
@@ -40,13 +42,10 @@ class TestMain(UiTestCase):
         main_page = MainPage(self.driver)
         main_page.wait_until_loaded()
         items = ["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Bolt T-Shirt"]
-        main_page.add_item_to_cart(items[0])
-        main_page.add_item_to_cart(items[1])
-        main_page.add_item_to_cart(items[2])
-        self.assertEqual(
-            3, main_page.get_cart_count(), f"There should be 3 items, "
-                                        f"but actually there are {main_page.get_cart_count()}"
-        )
+        self.assertEqual([], main_page.add_items_to_cart(items))
+        state = StateOracle(self.driver).read()
+        self.assertEqual(set(items), state.names, f"Cart in storage: {state.ids}")
+        self.assertEqual(3, state.count)
 
     @allure.story("Getting to the cart page")
     def test_get_cart_page(self):
@@ -54,7 +53,7 @@ class TestMain(UiTestCase):
         main_page = MainPage(self.driver)
         main_page.wait_until_loaded()
         main_page.open_cart()
-        self.assertEqual(self.driver.current_url, cart_address)
+        self.assertEqual(self.driver.current_url, url("cart.html"))
 
     @allure.story("Logging out")
     def test_logout(self):
@@ -62,4 +61,4 @@ class TestMain(UiTestCase):
         main_page = MainPage(self.driver)
         main_page.wait_until_loaded()
         main_page.logout()
-        self.assertEqual(self.driver.current_url, login_address)
\ No newline at end of file
+        self.assertEqual(self.driver.current_url, url())
\ No newline at end of file
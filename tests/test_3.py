@@ -1,21 +1,49 @@
 from src.base_test import UiTestCase
 from src.pages.cart_page import CartPage
+from src.pages.login_page import LoginPage
 from src.pages.main_page import MainPage
-from tests.test_2 import login_as_standard_user
+from src.utils.checkpoints import checkpoints
+from src.utils.data import VALID_USER
+from src.utils.state_oracle import StateOracle
 import allure
 
 ITEMS = ["Sauce Labs Backpack", "Sauce Labs Bike Light","Sauce Labs Bolt T-Shirt", "Sauce Labs Fleece Jacket"]
 def get_cart_page(driver, items=ITEMS) -> CartPage:
-    login_as_standard_user(driver)
-    main_page = MainPage(driver)
-    main_page.wait_until_loaded()
-    for name in items:
-        assert main_page.add_item_to_cart(name), f"Can't add item: {name}"
-    main_page.open_cart()
+    # session cookie + cart in localStorage instead of UI login and clicking "Add to cart";
+    # a checkpoint restore would cost the same commands, so no checkpoints here
+    LoginPage(driver).inject_session(VALID_USER, landing=None)
     cart = CartPage(driver)
+    cart.seed(items)
     cart.wait_until_loaded()
     return cart
 
+def _fill_cart_ui(items):
+    def setup(driver):
+        login = LoginPage(driver)
+        login.open()
+        login.login(VALID_USER["username"], VALID_USER["password"])
+        login.wait_success()
+        main = MainPage(driver)
+        missing = main.add_items_to_cart(items)
+        assert not missing, f"Not on the inventory page: {missing}"
+        main.open_cart()
+    return setup
+
+def _cart_holds(items):
+    def verify(driver):
+        CartPage(driver).wait_until_loaded()
+        state = StateOracle(driver).read()
+        # состояние из storage: протухшая сессия или чужая корзина падают сразу, а не по таймауту
+        assert state.user == VALID_USER["username"], f"Not logged in | {state.url}"
+        assert state.names == set(items) and state.count == len(items), f"Cart mismatch: {state.names}"
+    return verify
+
+def get_ui_cart(driver, items=ITEMS) -> CartPage:
+    # cart filled the way a user does it (login form, "Add to cart" clicks, cart link);
+    # the first test of a worker pays for it, later ones restore the checkpoint
+    checkpoints.use(f"ui cart:{','.join(items)}", driver, _fill_cart_ui(items), _cart_holds(items))
+    return CartPage(driver)
+
 @allure.epic("Website")
 @allure.feature("Cart")
 class TestMain(UiTestCase):
@@ -41,7 +69,10 @@ class TestMain(UiTestCase):
     def test_remove_item(self):
         cart = get_cart_page(self.driver, items=ITEMS)
         self.assertTrue(cart.remove_item_by_name("Sauce Labs Bike Light"))
-        self.assertEqual(len(ITEMS) - 1, cart.get_items_count())
+        state = StateOracle(self.driver).read()
+        self.assertEqual(set(ITEMS) - {"Sauce Labs Bike Light"}, state.names)
+        self.assertEqual(len(ITEMS) - 1, state.count)
+        # удаление строки — это рендеринг: проверяем и DOM
         self.assertNotIn("Sauce Labs Bike Light", cart.get_item_names())
 
     @allure.story("Return to main page")
@@ -1,7 +1,10 @@
 from src.base_test import UiTestCase
 from src.pages.checkout_page import CheckoutStepOnePage, CheckoutStepTwoPage, CheckoutCompletePage
 from src.pages.main_page import MainPage
-from tests.test_3 import get_cart_page, ITEMS
+from src.pages.navigator import Navigator, NavState
+from src.utils.browser_log import fail_on_js_errors
+from src.utils.profiler import command_budget
+from tests.test_3 import get_ui_cart, ITEMS
 import math
 import allure
 
@@ -11,42 +14,43 @@ import allure
 class TestCheckoutPage(UiTestCase):
     @allure.story("Open checkout page")
     def test_open_checkout_page(self):
-        cart = get_cart_page(self.driver, items=ITEMS)
+        cart = get_ui_cart(self.driver, items=ITEMS)
         cart.proceed_to_checkout()
         step_1 = CheckoutStepOnePage(self.driver)
         step_1.wait_until_loaded()
 
-        with allure.step(f"Current URL: {self.driver.current_url}"):
-            pass
+        self.step_url("Current URL")
 
         self.assertTrue(step_1.is_loaded())
         self.assertTrue(step_1.is_loaded(), f"Not on step-one, url={self.driver.current_url}")
 
     @allure.story("Finish the order successfully")
+    @command_budget(120)
+    @fail_on_js_errors
     def test_successful_checkout(self):
-        cart = get_cart_page(self.driver, items=ITEMS)
+        cart = get_ui_cart(self.driver, items=ITEMS)
         prices = cart.get_item_prices()
         expected_subtotal = round(sum(prices), 2)
 
         cart.proceed_to_checkout()
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
         step_1 = CheckoutStepOnePage(self.driver)
         step_1.wait_until_loaded()
 
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
         self.assertTrue(step_1.is_loaded(), f"Not on step-one | {self.driver.current_url}")
 
         step_1.fill_in_the_form("John", "Doe", "12345")
         step_1.proceed_to_payment()
 
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
         step_2 = CheckoutStepTwoPage(self.driver)
         step_2.wait_until_loaded()
 
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
         self.assertTrue(step_2.is_loaded(), f"Not on step-two | {self.driver.current_url}")
 
@@ -61,7 +65,7 @@ class TestCheckoutPage(UiTestCase):
 
         step_2.finish()
 
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
         step_3 = CheckoutCompletePage(self.driver)
         self.assertTrue(step_3.is_loaded(), f"Not on complete | {self.driver.current_url}")
@@ -69,13 +73,10 @@ class TestCheckoutPage(UiTestCase):
 
     @allure.story("Invalid test: let the fields empty")
     def test_empty_fields(self):
-        cart = get_cart_page(self.driver, items=ITEMS)
-        cart.proceed_to_checkout()
+        step_1 = Navigator(self.driver).goto(CheckoutStepOnePage, state=NavState(cart=ITEMS))
 
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
-        step_1 = CheckoutStepOnePage(self.driver)
-        step_1.wait_until_loaded()
         self.assertTrue(step_1.is_loaded())
 
         step_1.fill_in_the_form("", "", "")
@@ -86,30 +87,15 @@ class TestCheckoutPage(UiTestCase):
 
     @allure.story("Cancel the purchase")
     def test_cancel(self):
-        cart = get_cart_page(self.driver, items=ITEMS)
-        cart.proceed_to_checkout()
-
-        with allure.step(f"URL: {self.driver.current_url}"): pass
-
-        step_1 = CheckoutStepOnePage(self.driver)
-        step_1.wait_until_loaded()
-        self.assertTrue(step_1.is_loaded())
-
-        step_1.fill_in_the_form("John", "Doe", "12345")
-        step_1.proceed_to_payment()
-
-        with allure.step(f"URL: {self.driver.current_url}"): pass
-
-        step_2 = CheckoutStepTwoPage(self.driver)
-        step_2.wait_until_loaded()
+        step_2 = Navigator(self.driver).goto(CheckoutStepTwoPage, state=NavState(cart=ITEMS))
 
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
         self.assertTrue(step_2.is_loaded())
 
         step_2.cancel()
 
-        with allure.step(f"URL: {self.driver.current_url}"): pass
+        self.step_url()
 
         main = MainPage(self.driver)
         main.wait_until_loaded()
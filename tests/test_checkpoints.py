@@ -0,0 +1,91 @@
+"""
+Checkpoints without a browser: a stub session keeps cookies, localStorage and the URL the way
+capture/restore read and write them.
+"""
+import pytest
+
+from src.utils import checkpoints as cp
+from src.utils.checkpoints import Checkpoints
+
+ORIGIN = "http://stand"
+
+
+class StubSession:
+    def __init__(self):
+        self.url = "about:blank"
+        self.cookies: list[dict] = []
+        self.storage: dict[str, str] = {}
+        self.commands: list[str] = []
+
+    def get(self, url):
+        self.commands.append("get")
+        self.url = url
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append(cmd)
+        if cmd == "Network.getCookies":
+            return {"cookies": [dict(c, session=True, size=1) for c in self.cookies]}
+        self.cookies = list(params["cookies"])
+
+    def execute_script(self, js, *args):
+        self.commands.append("script")
+        if js == cp._CAPTURE_JS:
+            return {"url": self.url, "origin": ORIGIN, "storage": dict(self.storage)}
+        self.storage, self.url = dict(args[0]), args[1]
+
+
+def fill_cart(driver):
+    driver.get(ORIGIN + "/inventory.html")
+    driver.cookies = [{"name": "session-username", "value": "standard_user", "path": "/"}]
+    driver.storage = {"cart-contents": "[4,0]"}
+    driver.url = ORIGIN + "/cart.html"
+
+
+def cart_filled(driver):
+    assert driver.storage.get("cart-contents") == "[4,0]", "cart mismatch"
+    assert driver.cookies, "not logged in"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    monkeypatch.delenv("CHECKPOINTS", raising=False)
+    return Checkpoints()
+
+
+def test_setup_is_captured_then_restored(store):
+    first = StubSession()
+    store.use("cart", first, fill_cart, cart_filled)
+    assert (store.replayed, store.restored) == (1, 0)
+
+    second = StubSession()
+    store.use("cart", second, lambda d: pytest.fail("setup replayed"), cart_filled)
+
+    assert (store.replayed, store.restored) == (1, 1)
+    assert second.url == ORIGIN + "/cart.html" and second.storage == {"cart-contents": "[4,0]"}
+    assert second.cookies == [{"name": "session-username", "value": "standard_user", "path": "/"}]  # без expires
+    assert second.commands == ["Network.setCookies", "get", "script"]
+
+
+def test_failed_verify_falls_back_to_setup(store):
+    store.use("cart", StubSession(), fill_cart, cart_filled)
+    # стенд сбросил корзину: restore проходит, verify падает на AssertionError
+    store._saved["cart"] = cp.Checkpoint(ORIGIN + "/cart.html", ORIGIN, (), {})
+    driver = StubSession()
+    store.use("cart", driver, fill_cart, cart_filled)
+
+    assert (store.replayed, store.restored) == (2, 0)
+    assert store._saved["cart"].local_storage == {"cart-contents": "[4,0]"}  # снят заново
+
+
+def test_setup_that_does_not_verify_raises(store):
+    with pytest.raises(AssertionError):
+        store.use("cart", StubSession(), lambda d: None, cart_filled)
+    assert "cart" not in store._saved
+
+
+def test_disabled_always_replays(store, monkeypatch):
+    monkeypatch.setenv("CHECKPOINTS", "false")
+    for _ in range(2):
+        store.use("cart", StubSession(), fill_cart, cart_filled)
+    assert (store.replayed, store.restored) == (2, 0)
+    assert store._saved == {}
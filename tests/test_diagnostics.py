@@ -0,0 +1,142 @@
+"""
+UiTestCase diagnostics on failure, without a browser: a stub session carries the BiDi log buffer,
+the inner suite runs through pytest itself (pytester), as the real suite does.
+"""
+import json
+
+from src.utils import browser_log
+
+pytest_plugins = ["pytester"]
+
+INNER = '''
+import json
+import pytest
+import src.base_test as base_test
+from src.base_test import UiTestCase
+from src.utils.browser_log import BrowserLog, LogEntry, fail_on_js_errors
+
+ATTACHED = {attached!r}
+
+
+class FakeDriver:
+    def __init__(self):
+        self._browser_log = BrowserLog()
+        self.current_url = "http://stand/inventory.html"
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _stub_session(monkeypatch):
+    names = []
+    monkeypatch.setattr(base_test, "new_driver", FakeDriver)
+    monkeypatch.setattr(base_test.artifacts, "allowed", lambda: False)
+    monkeypatch.setattr(base_test.allure, "attach", lambda body, name, *a, **kw: names.append(name))
+    yield
+    with open(ATTACHED, "a", encoding="utf-8") as f:
+        f.write(json.dumps(names) + "\\n")
+
+
+def js_error(log):
+    log.add(LogEntry("js-error", "error", "TypeError: cart is undefined"))
+
+
+class TestInner(UiTestCase):
+    def test_a_fails_with_log(self):
+        js_error(self.browser_log)
+        self.fail("assertion")
+
+    def test_b_passes(self):
+        js_error(self.browser_log)  # без FAIL_ON_JS_ERRORS только копится в буфере
+
+    @fail_on_js_errors
+    def test_c_js_error_fails(self):
+        js_error(self.browser_log)
+
+    @fail_on_js_errors
+    def test_d_fails_once(self):
+        js_error(self.browser_log)
+        self.fail("assertion")
+'''
+
+
+def test_browser_log_on_failure(pytester, monkeypatch):
+    monkeypatch.setenv("BROWSER_LOG", "true")
+    monkeypatch.delenv("FAIL_ON_JS_ERRORS", raising=False)
+    attached = pytester.path / "attached.jsonl"
+    pytester.makepyfile(test_inner=INNER.format(attached=str(attached)))
+
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider")
+
+    # c: passing test fails in teardown (pytest reports unittest teardown errors as failures)
+    result.assert_outcomes(passed=1, failed=3)
+    runs = [json.loads(line) for line in attached.read_text(encoding="utf-8").splitlines()]
+    a, b, c, d = runs
+    assert "Browser log" in a
+    assert "Browser log" not in b
+    assert "Browser log" in c
+    assert d.count("Browser log") == 1  # уже упавший тест: без второй ошибки из teardown
+
+
+class StubBidi:
+    """WebSocketConnection surface of the oldest supported Selenium (4.38): execute + add_callback only."""
+
+    def __init__(self, fail: Exception | None = None):
+        self.fail = fail
+        self.sent = []
+        self.callbacks = {}
+
+    def execute(self, command):
+        payload = next(command)
+        self.sent.append(payload)
+        if self.fail:
+            raise self.fail
+        try:
+            command.send({})
+        except StopIteration as done:
+            return done.value
+
+    def add_callback(self, event, callback):
+        self.callbacks.setdefault(event.event_class, []).append(lambda params: callback(event.from_json(params)))
+
+    def emit(self, method, params):
+        for callback in self.callbacks.get(method, []):
+            callback(params)
+
+
+class StubSession:
+    def __init__(self, conn: StubBidi, bidi: bool = True):
+        self.caps = {"webSocketUrl": "ws://127.0.0.1/session"} if bidi else {}
+        self._websocket_connection = None
+        self._conn = conn
+
+    def _start_bidi(self):
+        self._websocket_connection = self._conn
+
+
+def test_attach_subscribes_through_execute(monkeypatch):
+    monkeypatch.setenv("BROWSER_LOG", "true")
+    monkeypatch.setenv("BROWSER_LOG_NETWORK", "true")
+    conn = StubBidi()
+    driver = StubSession(conn)
+
+    log = browser_log.attach(driver)
+
+    assert log is not None and browser_log.attach(driver) is log  # подписка один раз на сессию
+    assert conn.sent == [{"method": "session.subscribe", "params": {
+        "events": ["log.entryAdded", "network.responseCompleted", "network.fetchError"]}}]
+    conn.emit("log.entryAdded", {"type": "javascript", "level": "error", "text": "boom", "timestamp": 1000})
+    conn.emit("network.responseCompleted", {"request": {"url": "/ok"}, "response": {"status": 200}})
+    conn.emit("network.responseCompleted", {"request": {"url": "/x"}, "response": {"status": 503}})
+    assert [e.kind for e in log.snapshot()] == ["js-error", "http"]
+
+
+def test_attach_never_breaks_setup(monkeypatch):
+    monkeypatch.setenv("BROWSER_LOG", "true")
+    # ошибка не из WebDriverException (например, другой API соединения) — лога нет, теста не ломаем
+    conn = StubBidi(fail=AttributeError("no such command"))
+    driver = StubSession(conn)
+    assert browser_log.attach(driver) is None
+    assert conn.callbacks == {}
+    assert browser_log.attach(StubSession(StubBidi(), bidi=False)) is None
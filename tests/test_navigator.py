@@ -0,0 +1,50 @@
+"""
+Navigator.plan() without a browser: cheapest edge sequences for the prior edge costs.
+"""
+import pytest
+
+from src.pages.cart_page import CartPage
+from src.pages.checkout_page import CheckoutCompletePage, CheckoutStepOnePage, CheckoutStepTwoPage
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.pages.navigator import START, EdgeCosts, Facts, Navigator, NavState
+from src.utils.data import USER_INFO
+
+ITEMS = ("Sauce Labs Backpack", "Sauce Labs Bike Light")
+
+FRESH = Facts(START, False, False, False)
+LOGGED_IN = Facts(MainPage, True, False, False, cart_empty=True)
+FOREIGN_CART = Facts(MainPage, True, False, False)  # в storage чужая корзина
+CART_READY = Facts(CartPage, True, True, False)
+
+CASES = [
+    (FRESH, LoginPage, NavState(), ["load login"]),
+    (FRESH, MainPage, NavState(), ["session cookie"]),
+    (FRESH, CartPage, NavState(cart=ITEMS), ["session cookie", "seed cart"]),
+    (FRESH, CheckoutStepTwoPage, NavState(cart=ITEMS), ["session cookie", "seed cart", "load step two"]),
+    (FRESH, CheckoutCompletePage, NavState(cart=ITEMS),
+     ["session cookie", "seed cart", "load step two", "finish"]),
+    (LOGGED_IN, MainPage, NavState(), []),
+    (LOGGED_IN, MainPage, NavState(cart=ITEMS), ["add to cart"]),
+    (LOGGED_IN, CheckoutStepTwoPage, NavState(cart=ITEMS), ["add to cart", "load step two"]),
+    # "Add to cart" только добавляет — при непустой корзине её перезаписывает seed
+    (FOREIGN_CART, MainPage, NavState(cart=ITEMS), ["seed cart", "load inventory"]),
+    (FOREIGN_CART, CheckoutStepTwoPage, NavState(cart=ITEMS), ["seed cart", "load step two"]),
+    (CART_READY, CartPage, NavState(cart=ITEMS), []),
+    (CART_READY, CheckoutStepOnePage, NavState(cart=ITEMS), ["checkout"]),
+    (CART_READY, CheckoutStepTwoPage, NavState(cart=ITEMS), ["load step two"]),
+    (CART_READY, CheckoutStepTwoPage, NavState(cart=ITEMS, info=USER_INFO), ["checkout", "submit info"]),
+]
+
+
+@pytest.mark.parametrize("start, target, state, expected", CASES,
+                         ids=[f"{getattr(s.page, '__name__', s.page)}->{t.__name__}-{i}"
+                              for i, (s, t, _, _) in enumerate(CASES)])
+def test_plan(start, target, state, expected):
+    path = Navigator(None, edge_costs=EdgeCosts()).plan(target, state, start)
+    assert [edge.name for edge in path] == expected
+
+
+def test_no_path_without_cart_for_step_two():
+    # обзор заказа требует непустую корзину, а NavState её не задаёт
+    assert Navigator(None, edge_costs=EdgeCosts()).plan(CheckoutStepTwoPage, NavState(), FRESH) is None